@@ -0,0 +1,36 @@
+from typing import List
+
+
+class DisjointSet:
+    # Система непересекающихся множеств над номерами 0..size-1:
+    # сжатие путей в find и объединение по рангу дают почти O(1) на операцию
+    def __init__(self, size: int) -> None:
+        self._parent: List[int] = list(range(size))
+        self._rank: List[int] = [0] * size
+        self.count: int = size  # количество множеств (компонент связности)
+
+    def find(self, item: int) -> int:
+        root = item
+        while self._parent[root] != root:
+            root = self._parent[root]
+        # Сжатие пути: все вершины на пути подвешиваем прямо к корню
+        while self._parent[item] != root:
+            self._parent[item], item = root, self._parent[item]
+        return root
+
+    def union(self, item1: int, item2: int) -> bool:
+        # Возвращает False, если элементы уже были в одном множестве
+        root1 = self.find(item1)
+        root2 = self.find(item2)
+        if root1 == root2:
+            return False
+        if self._rank[root1] < self._rank[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        if self._rank[root1] == self._rank[root2]:
+            self._rank[root1] += 1
+        self.count -= 1
+        return True
+
+    def connected(self, item1: int, item2: int) -> bool:
+        return self.find(item1) == self.find(item2)
@@ -2,17 +2,20 @@
 # после чего используйте его для реализации алгоритма
 # поиска в глубину и алгоритма Прима. Добавьте возможность сохранения текущего представления графа в файл и загрузки из него.
 
+import os
+import sys
 import timeit
 from dataclasses import dataclass
-from typing import TypeVar, List, Optional
+from typing import TypeVar, Iterable, Iterator, List, Optional, Tuple, Union
 
-T = TypeVar("T")
+from mst import prim_lazy, prim_indexed, kruskal
 
-@dataclass
-class _PrimNode:
-    start: T
-    finish: T
-    weight: int
+# VertexIndex один на оба каталога и лежит в my_collections. Каталог добавляется в конец пути поиска,
+# поэтому здешние модули с теми же именами (graph, prim) по-прежнему находятся первыми
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "my_collections"))
+from vertex_index import VertexIndex
+
+T = TypeVar("T")
 
 @dataclass
 class Edge:
@@ -22,21 +25,84 @@ class Edge:
 
 class Graph:
     def __init__(self, is_directed: bool = False) -> None:
-        self.vertexes: List[T] = []
+        self.index: VertexIndex[T] = VertexIndex[T]()
+        self.vertexes: List[T] = self.index.labels
         self.edges: List[List[Optional[int]]] = []
         self.is_not_directed: bool = not is_directed
 
     def add_edge(self, vertex1: T, vertex2: T, weight: int) -> None:
-        if vertex1 not in self.vertexes or vertex2 not in self.vertexes:
+        if vertex1 not in self.index or vertex2 not in self.index:
             raise ValueError("Both vertices must be in the graph")
 
-        index1 = self.vertexes.index(vertex1)
-        index2 = self.vertexes.index(vertex2)
+        index1 = self.index.id_of(vertex1)
+        index2 = self.index.id_of(vertex2)
 
         self.edges[index1][index2] = weight
         if self.is_not_directed:
             self.edges[index2][index1] = weight
 
+    def remove_edge(self, vertex1: T, vertex2: T) -> None:
+        index1 = self.index.id_of(vertex1)
+        index2 = self.index.id_of(vertex2)
+        if self.edges[index1][index2] is None:
+            raise ValueError(f"Edge {vertex1} -> {vertex2} is not in the graph")
+        self.edges[index1][index2] = None
+        if self.is_not_directed:
+            self.edges[index2][index1] = None
+
+    def remove_vertex(self, vertex: T) -> None:
+        # Строка и столбец убираются из матрицы, номера следующих вершин сдвигаются на один
+        vertex_id = self.index.id_of(vertex)
+        del self.edges[vertex_id]
+        for row in self.edges:
+            del row[vertex_id]
+        self.index = VertexIndex[T](label for i, label in enumerate(self.vertexes) if i != vertex_id)
+        self.vertexes = self.index.labels
+
+    def add_edges_from(self, edges: Iterable[Union[Edge, Tuple[T, T, int]]]) -> None:
+        # Пакетное добавление: сначала все вершины переводятся в номера (ValueError - граф не меняется),
+        # затем веса пишутся в матрицу одним проходом
+        id_of = self.index.id_of
+        starts: List[int] = []
+        finishes: List[int] = []
+        weights: List[int] = []
+        for edge in edges:
+            if isinstance(edge, Edge):
+                start, finish, weight = edge.start_edge, edge.finish_edge, edge.weight
+            else:
+                start, finish, weight = edge
+            starts.append(id_of(start))
+            finishes.append(id_of(finish))
+            weights.append(weight)
+        self._write_edges(starts, finishes, weights)
+
+    def add_edges_from_arrays(self, src, dst, weight) -> None:
+        # Три массива одной длины (списки, array или NumPy): начала, концы и веса.
+        # Каждая различная вершина ищется в индексе один раз на весь пакет
+        if not len(src) == len(dst) == len(weight):
+            raise ValueError("src, dst and weight must have the same length")
+
+        if hasattr(src, "dtype") and hasattr(dst, "dtype"):
+            import numpy as np
+            labels, inverse = np.unique(np.concatenate((src, dst)), return_inverse=True)
+            lookup = np.array([self.index.id_of(label) for label in labels.tolist()], dtype=np.int64)
+            ids = lookup[inverse]
+            starts, finishes = ids[:len(src)].tolist(), ids[len(src):].tolist()
+        else:
+            ids = {vertex: self.index.id_of(vertex) for vertex in set(src).union(dst)}
+            starts, finishes = [ids[vertex] for vertex in src], [ids[vertex] for vertex in dst]
+        self._write_edges(starts, finishes, weight.tolist() if hasattr(weight, "tolist") else weight)
+
+    def _write_edges(self, starts: List[int], finishes: List[int], weights: List[int]) -> None:
+        edges = self.edges
+        if self.is_not_directed:
+            for index1, index2, weight in zip(starts, finishes, weights):
+                edges[index1][index2] = weight
+                edges[index2][index1] = weight
+        else:
+            for index1, index2, weight in zip(starts, finishes, weights):
+                edges[index1][index2] = weight
+
     def save_to_file(self, filename: str) -> None:
         with open(filename, "w") as file:
             file.write(f"{len(self.vertexes)}\n")
@@ -50,7 +116,8 @@ class Graph:
     def load_from_file(self, filename: str) -> None:
         with open(filename, "r") as file:
             num_vertexes = int(file.readline())
-            self.vertexes = [file.readline().strip() for _ in range(num_vertexes)]
+            self.index = VertexIndex[T](file.readline().strip() for _ in range(num_vertexes))
+            self.vertexes = self.index.labels
 
             self.edges = []
             for _ in range(num_vertexes):
@@ -73,89 +140,87 @@ class Graph:
         for row in matrix:
             print(" ".join(str(val) if val is not None else "0" for val in row))
 
-    # Внесем изменения в метод prim
-    def prim(self, start: T) -> None:
-        mst = Graph(is_directed=self.is_not_directed)
+    def prim(self, start: T, lazy: bool = True) -> 'Graph':
+        # lazy=True - ленивая куча ребер, lazy=False - индексная куча с уменьшением ключа
+        start_index = self.index.id_of(start)
+        tree = prim_lazy(self.edges, start_index) if lazy else prim_indexed(self.edges, start_index)
 
+        # Остов того же класса, что и граф (prim.Graph наследует этот метод)
+        mst = type(self)(is_directed=not self.is_not_directed)
         for vertex in self.vertexes:
             mst.add_vertex(vertex)
+        for index1, index2, weight in tree:
+            mst.add_edge(self.vertexes[index1], self.vertexes[index2], weight)
 
-        visited = set()
-        visited.add(start)
-
-        mst_matrix = [[None] * len(self.vertexes) for _ in range(len(self.vertexes))]
+        return mst
 
-        while len(visited) < len(self.vertexes):
-            heap = []
+    def kruskal(self) -> 'Graph':
+        # Направление ребер не учитывается, остов строится как для ненаправленного графа
+        tree = kruskal(len(self.vertexes), self.edge_list())
 
-            for i, vertex in enumerate(self.vertexes):
-                if vertex in visited:
-                    for j, weight in enumerate(self.edges[i]):
-                        if self.vertexes[j] not in visited and weight is not None:
-                            heap.append(_PrimNode(vertex, self.vertexes[j], weight))
-
-            if not heap:
-                break
-
-            heap.sort(key=lambda x: x.weight)
-            edge = heap[0]
-
-            mst.add_edge(edge.start, edge.finish, edge.weight)
-            visited.add(edge.finish)
+        mst = type(self)(is_directed=not self.is_not_directed)
+        for vertex in self.vertexes:
+            mst.add_vertex(vertex)
+        for index1, index2, weight in tree:
+            mst.add_edge(self.vertexes[index1], self.vertexes[index2], weight)
 
-            index1 = self.vertexes.index(edge.start)
-            index2 = self.vertexes.index(edge.finish)
-            mst_matrix[index1][index2] = edge.weight
-            if self.is_not_directed:
-                mst_matrix[index2][index1] = edge.weight
+        return mst
 
-        print("\nИспользование алгоритма Прима\nМинимальное остовное дерево:")
-        mst.print_all_vertexes()
-        mst.print_all_edges()
-        mst.print_matrix(mst_matrix)
+    def edge_list(self) -> List[Tuple[int, int, int]]:
+        # Список ребер (номер начала, номер конца, вес); у ненаправленного графа каждое ребро один раз
+        return [
+            (i, j, weight)
+            for i, row in enumerate(self.edges)
+            for j, weight in enumerate(row)
+            if weight is not None and (not self.is_not_directed or i < j)
+        ]
 
     def add_vertex(self, vertex: T) -> None:
-        if vertex not in self.vertexes:
-            self.vertexes.append(vertex)
+        if vertex not in self.index:
+            self.index.add(vertex)
             for row in self.edges:
                 row.append(None)
             self.edges.append([None] * len(self.vertexes))
         else:
             print(f"Вершина {vertex} уже добавлена в граф")
 
-    def dfs(self, start: T, visit_func: Optional[callable] = None) -> None:
-        visited = set()
-
-        def dfs_recursive(vertex: T, path: List[T]) -> None:
-            visited.add(vertex)
-            path.append(vertex)
-
-            if visit_func:
-                visit_func(vertex, path)
-
-            for i, adjacent in enumerate(self.edges[self.vertexes.index(vertex)]):
-                if adjacent is not None and self.vertexes[i] not in visited:
-                    dfs_recursive(self.vertexes[i], path[:])  # передача копии пути
-
-        dfs_recursive(start, [])
-
-def print_path(vertex: str, path: List[str]) -> None:
+    def dfs(self, start: T) -> Iterator[Tuple[T, Tuple[T, ...]]]:
+        # Обход в глубину на явном стеке: в stack лежат итераторы по строкам матрицы.
+        # Вершины выдаются лениво в порядке посещения вместе с путем от start (снимок кортежем),
+        # поэтому обход можно прервать, как только нужная вершина найдена
+        visited = [False] * len(self.vertexes)
+        start_index = self.index.id_of(start)
+        visited[start_index] = True
+        path: List[T] = [start]
+        stack = [enumerate(self.edges[start_index])]
+        yield start, (start,)
+
+        while stack:
+            for i, adjacent in stack[-1]:
+                if adjacent is not None and not visited[i]:
+                    visited[i] = True
+                    path.append(self.vertexes[i])
+                    stack.append(enumerate(self.edges[i]))
+                    yield self.vertexes[i], tuple(path)
+                    break
+            else:
+                stack.pop()
+                path.pop()
+
+def print_path(vertex: str, path: Tuple[str, ...]) -> None:
     print(f"Path to {vertex}: {' -> '.join(path)}")
 
 def benchmark_dfs(graph, start_vertex, num_trials=100):
     def run_dfs():
-        graph.dfs(start_vertex)
+        for _ in graph.dfs(start_vertex):
+            pass
 
     time = timeit.timeit(run_dfs, number=num_trials)
     print(f"Время выполнения поиска в глубину {num_trials} раз: {time} секунд")
 
 def benchmark_prim(graph, start_vertex, num_trials=100):
-    # Вызов алгоритма Прима один раз перед началом цикла
-    prim_result = graph.prim(start_vertex)
-
     def run_prim():
-        # Использование результата, сохраненного ранее
-        prim_result
+        graph.prim(start_vertex)
 
     time = timeit.timeit(run_prim, number=num_trials)
     print(f"Время выполнения алгоритма Прима {num_trials} раз: {time} секунд")
@@ -190,8 +255,18 @@ if __name__ == '__main__':
     graph.print_matrix(graph.edges)
 
     print("\nDFS:")
-    graph.dfs("A", visit_func=print_path)
-    graph.prim("A")
+    for vertex, path in graph.dfs("A"):
+        print_path(vertex, path)
+
+    mst = graph.prim("A")
+    print("\nИспользование алгоритма Прима\nМинимальное остовное дерево:")
+    mst.print_all_vertexes()
+    mst.print_all_edges()
+    mst.print_matrix(mst.edges)
+
+    mst = graph.kruskal()
+    print("\nИспользование алгоритма Краскала\nМинимальное остовное дерево:")
+    mst.print_all_edges()
 
     print("\nБЕНЧМАРКИ")
     benchmark_dfs(graph, "A")
@@ -0,0 +1,80 @@
+import math
+from typing import List, Tuple
+
+
+class IndexedHeap:
+    # Двоичная куча по номерам 0..capacity-1, для каждого номера хранится позиция в куче,
+    # поэтому уменьшение ключа (decrease-key) работает за O(log n) без дубликатов в куче
+    def __init__(self, capacity: int) -> None:
+        self._heap: List[int] = []
+        self._position: List[int] = [-1] * capacity
+        self._key: List[float] = [math.inf] * capacity
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item: int) -> bool:
+        return self._position[item] != -1
+
+    def key(self, item: int) -> float:
+        return self._key[item]
+
+    def push_or_decrease(self, item: int, key: float) -> bool:
+        # Возвращает True, если элемент добавлен или его ключ уменьшился
+        position = self._position[item]
+        if position == -1:
+            self._key[item] = key
+            self._position[item] = len(self._heap)
+            self._heap.append(item)
+            self._sift_up(len(self._heap) - 1)
+            return True
+        if key < self._key[item]:
+            self._key[item] = key
+            self._sift_up(position)
+            return True
+        return False
+
+    def pop(self) -> Tuple[int, float]:
+        if not self._heap:
+            raise IndexError("pop from empty heap")
+        top = self._heap[0]
+        last = self._heap.pop()
+        self._position[top] = -1
+        if self._heap:
+            self._heap[0] = last
+            self._position[last] = 0
+            self._sift_down(0)
+        return top, self._key[top]
+
+    def _sift_up(self, position: int) -> None:
+        item = self._heap[position]
+        key = self._key[item]
+        while position > 0:
+            parent = (position - 1) // 2
+            parent_item = self._heap[parent]
+            if self._key[parent_item] <= key:
+                break
+            self._heap[position] = parent_item
+            self._position[parent_item] = position
+            position = parent
+        self._heap[position] = item
+        self._position[item] = position
+
+    def _sift_down(self, position: int) -> None:
+        size = len(self._heap)
+        item = self._heap[position]
+        key = self._key[item]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and self._key[self._heap[child + 1]] < self._key[self._heap[child]]:
+                child += 1
+            child_item = self._heap[child]
+            if self._key[child_item] >= key:
+                break
+            self._heap[position] = child_item
+            self._position[child_item] = position
+            position = child
+        self._heap[position] = item
+        self._position[item] = position
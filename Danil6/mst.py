@@ -0,0 +1,75 @@
+"""
+Алгоритм Прима на куче.
+Вершины и ребра задаются номерами, граф - матрицей смежности (None - нет ребра).
+Результат - список ребер остовного дерева (откуда, куда, вес) в порядке добавления.
+1) prim_lazy - в кучу кладутся все ребра разреза, устаревшие (ведущие в уже взятые вершины) пропускаются при извлечении.
+2) prim_indexed - в куче не больше одной записи на вершину, при нахождении более легкого ребра ключ уменьшается (decrease-key).
+Алгоритм Краскала (kruskal) принимает список ребер, один раз сортирует его по весу и добавляет ребра,
+соединяющие разные компоненты (проверка через систему непересекающихся множеств). Получается O(E log E).
+"""
+import heapq
+from typing import Iterable, List, Optional, Tuple
+
+from disjoint_set import DisjointSet
+from indexed_heap import IndexedHeap
+
+MSTEdge = Tuple[int, int, int]
+
+
+def prim_lazy(matrix: List[List[Optional[int]]], start: int) -> List[MSTEdge]:
+    amount_vertex = len(matrix)
+    visited = [False] * amount_vertex
+    tree: List[MSTEdge] = []
+    heap: List[Tuple[int, int, int]] = []  # (вес, откуда, куда)
+
+    def visit(vertex: int) -> None:
+        visited[vertex] = True
+        for j, weight in enumerate(matrix[vertex]):
+            if weight is not None and not visited[j]:
+                heapq.heappush(heap, (weight, vertex, j))
+
+    visit(start)
+    while heap and len(tree) < amount_vertex - 1:
+        weight, vertex, finish = heapq.heappop(heap)
+        if visited[finish]:
+            continue
+        tree.append((vertex, finish, weight))
+        visit(finish)
+
+    return tree
+
+
+def prim_indexed(matrix: List[List[Optional[int]]], start: int) -> List[MSTEdge]:
+    amount_vertex = len(matrix)
+    in_tree = [False] * amount_vertex
+    parent: List[int] = [-1] * amount_vertex
+    tree: List[MSTEdge] = []
+    heap = IndexedHeap(amount_vertex)
+    heap.push_or_decrease(start, 0)
+
+    while len(heap):
+        vertex, weight = heap.pop()
+        in_tree[vertex] = True
+        if parent[vertex] != -1:
+            tree.append((parent[vertex], vertex, weight))
+
+        for j, edge_weight in enumerate(matrix[vertex]):
+            if edge_weight is not None and not in_tree[j] and edge_weight < heap.key(j):
+                heap.push_or_decrease(j, edge_weight)
+                parent[j] = vertex
+
+    return tree
+
+
+def kruskal(amount_vertex: int, edges: Iterable[MSTEdge]) -> List[MSTEdge]:
+    # Для несвязного графа получается остовный лес
+    components = DisjointSet(amount_vertex)
+    tree: List[MSTEdge] = []
+
+    for start, finish, weight in sorted(edges, key=lambda edge: edge[2]):
+        if components.union(start, finish):
+            tree.append((start, finish, weight))
+            if len(tree) == amount_vertex - 1:
+                break
+
+    return tree
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import TypeVar, List, Optional, Tuple, Callable, Generic
-from set import Queue, MySet
+from typing import TypeVar, List, Optional, Tuple, Callable, Generic, Iterator
+
+from vertex_index import VertexIndex
 
-T = TypeVar("T")
 T = TypeVar("T")
 
 
@@ -14,56 +14,48 @@ class _Node:
 
 class Graph:
     def __init__(self, is_directed: bool = False) -> None:
-        self.vertexes: List[T] = []
+        self.index: VertexIndex[T] = VertexIndex[T]()
+        self.vertexes: List[T] = self.index.labels
         self.edges: List[List[Optional[int]]] = []
         self.is_not_directed: bool = not is_directed
 
     def add_vertex(self, vertex: T) -> None:
-        if vertex not in self.vertexes:
-            self.vertexes.append(vertex)
+        if vertex not in self.index:
+            self.index.add(vertex)
             for row in self.edges:
                 row.append(None)
             self.edges.append([None] * len(self.vertexes))
 
     def add_edge(self, vertex1: T, vertex2: T, weight: int) -> None:
-        if vertex1 not in self.vertexes or vertex2 not in self.vertexes:
+        if vertex1 not in self.index or vertex2 not in self.index:
             raise ValueError("Both vertices must be in the graph")
 
-        index1 = self.vertexes.index(vertex1)
-        index2 = self.vertexes.index(vertex2)
+        index1 = self.index.id_of(vertex1)
+        index2 = self.index.id_of(vertex2)
 
         self.edges[index1][index2] = weight
         if self.is_not_directed:
             self.edges[index2][index1] = weight
 
     def for_each_adjacent_edge(self, vertex: T, callback: Callable[[Tuple[T, int]], None]) -> None:
-        vertex_index = self.vertexes.index(vertex)
+        vertex_index = self.index.id_of(vertex)
         for j, weight in enumerate(self.edges[vertex_index]):
             if weight is not None:
                 callback((self.vertexes[j], weight))
 
-    def bfs(self, start: T, walkfunc: Callable[[T], bool]) -> None:
-        queue = Queue[T]()
-        visited = MySet[T]()
-        queue.enqueue(start)
-
-        def __foreach(adjacent_edge: Tuple[T, int]) -> None:
-            if not visited.contains(adjacent_edge[0]):
-                queue.enqueue(adjacent_edge[0])
+    def amount_vertexes(self) -> int:
+        return len(self.vertexes)
 
-        while not queue.is_empty():
-            vertex = queue.dequeue()
+    def neighbour_ids(self, vertex_id: int) -> Iterator[int]:
+        # Номера соседей по строке матрицы - этого достаточно для общего обхода bfs.bfs
+        return (j for j, weight in enumerate(self.edges[vertex_id]) if weight is not None)
 
-            if walkfunc(vertex):
-                return
-
-            visited.add(vertex)
-
-            self.for_each_adjacent_edge(vertex, __foreach)
+    def bfs(self, start: T, walkfunc: Callable[[T], bool]) -> None:
+        from bfs import bfs
+        bfs(self, start, walkfunc)
 
     def ford_bellman(self, start: T, end: T) -> Tuple[List[T], int]:
         nodes = {vertex: _Node(float('inf'), None) for vertex in self.vertexes}
-        start_index = self.vertexes.index(start)
         nodes[start].cost = 0
 
         for _ in range(len(self.vertexes) - 1):
@@ -117,7 +109,8 @@ class Graph:
     def load_from_file(self, filename: str) -> None:
         with open(filename, "r") as file:
             num_vertexes = int(file.readline())
-            self.vertexes = [file.readline().strip() for _ in range(num_vertexes)]
+            self.index = VertexIndex[T](file.readline().strip() for _ in range(num_vertexes))
+            self.vertexes = self.index.labels
 
             self.edges = []
             for _ in range(num_vertexes):
@@ -0,0 +1,216 @@
+"""
+Граф на списках смежности с удалением ребер и вершин.
+Для каждой вершины хранятся два массива: номера соседей и веса ребер (у направленного графа еще списки входящих ребер).
+Удаление работает через "надгробия" (tombstones), без сдвига массивов:
+1) remove_edge - запись ребра в списке начала (и зеркальная запись) помечается номером -1, O(степень);
+2) remove_vertex - вершина помечается мертвой, ее метка убирается из индекса, а номер не переиспользуется.
+   Записи соседей, ведущие в мертвую вершину, пропускаются при обходе, поэтому удаление - O(степень вершины).
+Надгробия занимают память и замедляют обход, поэтому compact() переписывает хранилище заново,
+когда их доля превышает порог. После compact() номера вершин сдвигаются и снова идут подряд.
+До compact() amount_vertexes() - это количество номеров, включая удаленные: алгоритмы по номерам
+(bfs_levels, components и т.д.) видят удаленные вершины как изолированные. В результатах с метками вершин
+(topological_sort, dijkstra без end, johnson) удаленных вершин нет: такие алгоритмы пропускают номера,
+для которых is_alive() ложно (у Graph и CSRGraph он всегда истинен).
+"""
+from array import array
+from typing import Callable, Generic, Iterator, List, Tuple
+
+from graph import T, Edge, AdjacentEdge
+from vertex_index import VertexIndex
+
+_REMOVED = -1
+
+
+class AdjacencyListGraph(Generic[T]):
+    def __init__(self, is_directed: bool = False) -> None:
+        self.index: VertexIndex[T] = VertexIndex[T]()
+        self.vertexes: List[T] = self.index.labels
+        self.is_not_directed: bool = not is_directed
+        self._alive = bytearray()
+        # Исходящие ребра: номера концов и веса; у направленного графа отдельно входящие (для remove_vertex)
+        self._targets: List[array] = []
+        self._weights: List[array] = []
+        self._sources: List[array] = []
+        self._source_weights: List[array] = []
+        self._dead_vertexes: int = 0
+        self._entries: int = 0  # все записи в списках, включая надгробия
+        self._dead_entries: int = 0
+
+    def add_vertex(self, vertex: T) -> None:
+        if vertex in self.index:
+            return
+        self.index.add(vertex)
+        self._alive.append(1)
+        for lists in (self._targets, self._weights, self._sources, self._source_weights):
+            lists.append(array("q"))
+
+    def add_edge(self, vertex1: T, vertex2: T, weight: int) -> None:
+        # Как у Graph: между парой вершин одно ребро, повторное добавление меняет вес
+        if vertex1 not in self.index or vertex2 not in self.index:
+            raise ValueError("Both vertices must be in the graph")
+        index1 = self.index.id_of(vertex1)
+        index2 = self.index.id_of(vertex2)
+
+        self._set_entry(self._targets[index1], self._weights[index1], index2, weight)
+        if self.is_not_directed:
+            if index1 != index2:
+                self._set_entry(self._targets[index2], self._weights[index2], index1, weight)
+        else:
+            self._set_entry(self._sources[index2], self._source_weights[index2], index1, weight)
+
+    def remove_edge(self, vertex1: T, vertex2: T) -> None:
+        index1 = self.index.id_of(vertex1)
+        index2 = self.index.id_of(vertex2)
+        if not self._drop_entry(self._targets[index1], index2):
+            raise ValueError(f"Edge {vertex1} -> {vertex2} is not in the graph")
+        if self.is_not_directed:
+            if index1 != index2:
+                self._drop_entry(self._targets[index2], index1)
+        else:
+            self._drop_entry(self._sources[index2], index1)
+
+    def remove_vertex(self, vertex: T) -> None:
+        vertex_id = self.index.id_of(vertex)
+        # Живые записи вершины и их зеркальные записи у соседей становятся надгробиями (у петли зеркала нет)
+        alive = self._alive
+        for ids in (self._targets[vertex_id], self._sources[vertex_id]):
+            for other in ids:
+                if other != _REMOVED and alive[other]:
+                    self._dead_entries += 1 if other == vertex_id else 2
+
+        alive[vertex_id] = 0
+        self.index.discard(vertex)
+        self._dead_vertexes += 1
+
+    def tombstone_ratio(self) -> float:
+        # Наибольшая из долей удаленных номеров вершин и удаленных записей в списках
+        vertex_ratio = self._dead_vertexes / len(self.vertexes) if self.vertexes else 0.0
+        entry_ratio = self._dead_entries / self._entries if self._entries else 0.0
+        return max(vertex_ratio, entry_ratio)
+
+    def compact(self, threshold: float = 0.25) -> bool:
+        # Переписывает хранилище без надгробий, если их доля больше threshold; True - граф перестроен.
+        # Номера живых вершин сдвигаются к началу, порядок вершин сохраняется
+        if self.tombstone_ratio() <= threshold:
+            return False
+
+        alive = self._alive
+        new_ids = array("q", [_REMOVED]) * len(self.vertexes)
+        index = VertexIndex[T]()
+        for vertex_id, label in enumerate(self.vertexes):
+            if alive[vertex_id]:
+                new_ids[vertex_id] = index.add(label)
+
+        def rewrite(ids: List[array], weights: List[array]) -> Tuple[List[array], List[array]]:
+            new_targets: List[array] = []
+            new_weights: List[array] = []
+            for vertex_id in range(len(ids)):
+                if not alive[vertex_id]:
+                    continue
+                row_ids, row_weights = array("q"), array("q")
+                for finish, weight in zip(ids[vertex_id], weights[vertex_id]):
+                    if finish != _REMOVED and alive[finish]:
+                        row_ids.append(new_ids[finish])
+                        row_weights.append(weight)
+                new_targets.append(row_ids)
+                new_weights.append(row_weights)
+            return new_targets, new_weights
+
+        self._targets, self._weights = rewrite(self._targets, self._weights)
+        self._sources, self._source_weights = rewrite(self._sources, self._source_weights)
+        self.index = index
+        self.vertexes = index.labels
+        self._alive = bytearray([1]) * len(index)
+        self._dead_vertexes = 0
+        self._dead_entries = 0
+        self._entries = sum(map(len, self._targets)) + sum(map(len, self._sources))
+        return True
+
+    def amount_vertexes(self) -> int:
+        # Количество номеров вершин, включая удаленные до compact()
+        return len(self.vertexes)
+
+    def is_alive(self, vertex_id: int) -> bool:
+        # False - номер принадлежал удаленной вершине (до compact())
+        return bool(self._alive[vertex_id])
+
+    def for_each_vertex(self, callback: Callable[[T], None]) -> None:
+        for vertex_id, vertex in enumerate(self.vertexes):
+            if self._alive[vertex_id]:
+                callback(vertex)
+
+    def for_each_edge(self, callback: Callable[[Edge[T]], None]) -> None:
+        # Для ненаправленного графа каждое ребро встречается в обе стороны, как у Graph
+        for vertex_id, vertex in enumerate(self.vertexes):
+            if self._alive[vertex_id]:
+                for finish, weight in self.neighbours(vertex_id):
+                    callback(Edge(vertex, self.vertexes[finish], weight))
+
+    def for_each_adjacent_edge(self, vertex: T, callback: Callable[[AdjacentEdge[T]], None]) -> None:
+        for finish, weight in self.neighbours(self.index.id_of(vertex)):
+            callback(AdjacentEdge(self.vertexes[finish], weight))
+
+    def neighbours(self, vertex_id: int) -> Iterator[Tuple[int, int]]:
+        # Соседи вершины по номерам: пары (номер соседа, вес), надгробия и удаленные вершины пропускаются
+        if not self._alive[vertex_id]:
+            return
+        alive = self._alive
+        for finish, weight in zip(self._targets[vertex_id], self._weights[vertex_id]):
+            if finish != _REMOVED and alive[finish]:
+                yield finish, weight
+
+    def neighbour_ids(self, vertex_id: int) -> Iterator[int]:
+        if not self._alive[vertex_id]:
+            return
+        alive = self._alive
+        for finish in self._targets[vertex_id]:
+            if finish != _REMOVED and alive[finish]:
+                yield finish
+
+    def neighbour_weights(self, vertex_id: int) -> Iterator[int]:
+        # Веса в том же порядке, что и neighbour_ids
+        for _, weight in self.neighbours(vertex_id):
+            yield weight
+
+    def in_neighbours(self, vertex_id: int) -> Iterator[Tuple[int, int]]:
+        if self.is_not_directed:
+            yield from self.neighbours(vertex_id)
+            return
+        if not self._alive[vertex_id]:
+            return
+        alive = self._alive
+        for start, weight in zip(self._sources[vertex_id], self._source_weights[vertex_id]):
+            if start != _REMOVED and alive[start]:
+                yield start, weight
+
+    def _set_entry(self, ids: array, weights: array, key: int, weight: int) -> None:
+        # Обновляет вес существующей записи или добавляет новую в конец списка
+        for position, vertex_id in enumerate(ids):
+            if vertex_id == key:
+                weights[position] = weight
+                return
+        ids.append(key)
+        weights.append(weight)
+        self._entries += 1
+
+    def _drop_entry(self, ids: array, key: int) -> bool:
+        for position, vertex_id in enumerate(ids):
+            if vertex_id == key:
+                ids[position] = _REMOVED
+                self._dead_entries += 1
+                return True
+        return False
+
+
+if __name__ == '__main__':
+    graph: AdjacencyListGraph[str] = AdjacencyListGraph[str](is_directed=True)
+    for vertex in "ABCDE":
+        graph.add_vertex(vertex)
+    for start, finish, weight in [("A", "B", 1), ("B", "C", 2), ("C", "D", 3), ("D", "E", 4), ("A", "E", 10)]:
+        graph.add_edge(start, finish, weight)
+
+    graph.remove_edge("A", "E")
+    graph.remove_vertex("C")
+    print(f"Tombstones: {graph.tombstone_ratio():.2f}")
+    graph.for_each_edge(lambda edge: print(f"{edge.start_edge} --({edge.weight})--> {edge.finish_edge}"))
+    print(f"Compacted: {graph.compact()}, vertexes: {graph.vertexes}")
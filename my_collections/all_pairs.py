@@ -0,0 +1,108 @@
+"""
+Кратчайшие пути между всеми парами вершин вместе с матрицей следующего шага (next hop).
+next_hop[u][v] - номер вершины, в которую нужно пойти из u, чтобы кратчайшим путем прийти в v (-1 - пути нет).
+Матрица хранится одним плоским массивом V * V, путь восстанавливается за O(длины пути) без пересчета.
+Флойд-Уоршелл обновляет next_hop вместе со стоимостью: если путь через k короче, то next_hop[i][j] = next_hop[i][k].
+При добавлении ребра (u, v, w) или уменьшении его веса результат обновляется за O(V^2) без полного пересчета:
+d'(i, j) = min(d(i, j), d(i, u) + w + d(v, j)).
+"""
+import math
+from array import array
+from typing import Generic, List, Sequence, TypeVar
+
+from vertex_index import VertexIndex
+
+T = TypeVar("T")
+
+
+class AllPairs(Generic[T]):
+    def __init__(self, index: VertexIndex[T], costs: List[List[float]], next_hop: Sequence[int]) -> None:
+        self.index: VertexIndex[T] = index
+        self.costs: List[List[float]] = costs
+        self.next_hop: Sequence[int] = next_hop  # плоский массив V * V
+        self.amount_vertex: int = len(costs)
+
+    def cost(self, start: T, end: T) -> float:
+        return self.costs[self.index.id_of(start)][self.index.id_of(end)]
+
+    def path(self, start: T, end: T) -> List[T]:
+        # Пустой список - пути нет. Как и в cost, путь из вершины в себя - самый дешевый цикл через нее:
+        # [start, ..., start], а если цикла нет - пустой список (стоимость inf)
+        start_id = self.index.id_of(start)
+        end_id = self.index.id_of(end)
+        amount_vertex = self.amount_vertex
+        if self.next_hop[start_id * amount_vertex + end_id] == -1:
+            return []
+
+        path = [start]
+        vertex = start_id
+        while True:
+            vertex = self.next_hop[vertex * amount_vertex + end_id]
+            path.append(self.index.label_of(vertex))
+            if vertex == end_id:
+                return path
+            if len(path) > amount_vertex:
+                raise ValueError("Path goes through a negative cycle")
+
+    def add_vertex(self) -> None:
+        # Новая вершина без ребер: добавляются пустые строка и столбец, массив next_hop перекладывается
+        amount_vertex = self.amount_vertex
+        next_hop = array("l", [-1]) * ((amount_vertex + 1) * (amount_vertex + 1))
+        for i in range(amount_vertex):
+            base = i * (amount_vertex + 1)
+            next_hop[base:base + amount_vertex] = array("l", self.next_hop[i * amount_vertex:(i + 1) * amount_vertex])
+            self.costs[i].append(math.inf)
+        self.costs.append([math.inf] * (amount_vertex + 1))
+        self.next_hop = next_hop
+        self.amount_vertex = amount_vertex + 1
+
+    def relax_edge(self, start: int, finish: int, weight: int) -> None:
+        # Учет нового ребра start -> finish (или уменьшения его веса) за O(V^2).
+        # Путь из вершины в себя нулевой, а диагональ матрицы - стоимость цикла, поэтому i == start и j == finish отдельно
+        amount_vertex = self.amount_vertex
+        costs = self.costs
+        next_hop = self.next_hop
+        to_start = [0 if i == start else costs[i][start] for i in range(amount_vertex)]
+        from_finish = [0 if j == finish else cost for j, cost in enumerate(costs[finish])]
+
+        for i in range(amount_vertex):
+            cost_to_start = to_start[i]
+            if cost_to_start == math.inf:
+                continue
+            row_i = costs[i]
+            base = i * amount_vertex
+            hop = finish if i == start else next_hop[base + start]
+            for j in range(amount_vertex):
+                new_cost = cost_to_start + weight + from_finish[j]
+                if new_cost < row_i[j]:
+                    row_i[j] = new_cost
+                    next_hop[base + j] = hop
+
+
+def ford_warshall_paths(graph) -> AllPairs:
+    amount_vertex = graph.amount_vertexes()
+    costs: List[List[float]] = [[math.inf] * amount_vertex for _ in range(amount_vertex)]
+    next_hop = array("l", [-1]) * (amount_vertex * amount_vertex)
+
+    for i in range(amount_vertex):
+        for j, weight in graph.neighbours(i):
+            if weight < costs[i][j]:
+                costs[i][j] = weight
+                next_hop[i * amount_vertex + j] = j
+
+    for k in range(amount_vertex):
+        row_k = costs[k]
+        for i in range(amount_vertex):
+            cost_ik = costs[i][k]
+            if cost_ik == math.inf:
+                continue
+            row_i = costs[i]
+            base = i * amount_vertex
+            hop = next_hop[base + k]
+            for j in range(amount_vertex):
+                new_cost = cost_ik + row_k[j]
+                if new_cost < row_i[j]:
+                    row_i[j] = new_cost
+                    next_hop[base + j] = hop
+
+    return AllPairs(graph.index, costs, next_hop)
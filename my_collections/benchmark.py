@@ -0,0 +1,218 @@
+"""
+Замеры алгоритмов на сгенерированных графах.
+Генераторы возвращают список ребер (начало, конец, вес) по номерам вершин 0..amount_vertex - 1:
+sparse - случайный разреженный граф, dense - случайный плотный, grid - решетка, scale_free - модель Барабаши-Альберт,
+negative - разреженный граф с отрицательными весами без отрицательных циклов (веса w + h(u) - h(v), w >= 0).
+Каждый граф строится в представлениях matrix (Graph на матрице смежности) и csr (CSRGraph),
+на них запускаются bfs, dfs, ford_bellman, dijkstra и ford_warshall (кубические алгоритмы только до fw_limit вершин).
+Остовные деревья (prim, prim_indexed, kruskal из Danil6/mst.py) считаются на том же наборе ребер
+в представлении undirected - ненаправленный Graph на матрице.
+Для каждого запуска в JSON пишутся время, операций в секунду и пиковая память (tracemalloc, отдельным прогоном).
+С --compare результаты сравниваются с прошлым файлом и печатаются замеры, ставшие медленнее.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bfs import bfs, bfs_levels
+from csr_graph import CSRGraph
+from dfs import dfs
+from dijkstra import dijkstra
+from ford_warshall import ford_warshall
+from fordbellman import ford_bellman
+from graph import Graph, Edge
+
+# Алгоритмы остовного дерева лежат в Danil6; каталог добавляется в конец пути поиска,
+# чтобы одноименные модули (graph, prim) брались отсюда
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Danil6"))
+from mst import kruskal, prim_indexed, prim_lazy
+
+BACKENDS = ["matrix", "csr", "undirected"]
+
+WeightedEdge = Tuple[int, int, int]
+
+
+def sparse(amount_vertex: int, degree: int = 4, max_weight: int = 100, seed: int = 0) -> List[WeightedEdge]:
+    generator = random.Random(seed)
+    return [(generator.randrange(amount_vertex), generator.randrange(amount_vertex), generator.randint(1, max_weight))
+            for _ in range(amount_vertex * degree)]
+
+
+def dense(amount_vertex: int, density: float = 0.5, max_weight: int = 100, seed: int = 0) -> List[WeightedEdge]:
+    generator = random.Random(seed)
+    return [(i, j, generator.randint(1, max_weight))
+            for i in range(amount_vertex) for j in range(amount_vertex)
+            if i != j and generator.random() < density]
+
+
+def grid(amount_vertex: int, max_weight: int = 100, seed: int = 0) -> List[WeightedEdge]:
+    # Квадратная решетка со стороной int(sqrt(amount_vertex)), ребра в обе стороны
+    generator = random.Random(seed)
+    side = max(1, int(amount_vertex ** 0.5))
+    edges: List[WeightedEdge] = []
+    for x in range(side):
+        for y in range(side):
+            vertex = x * side + y
+            for neighbour in ((vertex + side) if x + 1 < side else -1, (vertex + 1) if y + 1 < side else -1):
+                if neighbour != -1:
+                    weight = generator.randint(1, max_weight)
+                    edges.append((vertex, neighbour, weight))
+                    edges.append((neighbour, vertex, weight))
+    return edges
+
+
+def scale_free(amount_vertex: int, degree: int = 2, max_weight: int = 100, seed: int = 0) -> List[WeightedEdge]:
+    # Новая вершина соединяется с degree вершинами, выбранными пропорционально их степени
+    generator = random.Random(seed)
+    edges: List[WeightedEdge] = []
+    ends: List[int] = list(range(min(degree, amount_vertex)))  # каждая вершина встречается столько раз, какова ее степень
+    for vertex in range(len(ends), amount_vertex):
+        for target in {generator.choice(ends) for _ in range(degree)}:
+            weight = generator.randint(1, max_weight)
+            edges.append((vertex, target, weight))
+            edges.append((target, vertex, weight))
+            ends += (vertex, target)
+    return edges
+
+
+def negative(amount_vertex: int, degree: int = 4, max_weight: int = 100, seed: int = 0) -> List[WeightedEdge]:
+    # Вес цикла равен сумме исходных весов w >= 0, поэтому отрицательных циклов нет
+    generator = random.Random(seed)
+    potential = [generator.randint(0, max_weight) for _ in range(amount_vertex)]
+    return [(u, v, w + potential[u] - potential[v])
+            for u, v, w in sparse(amount_vertex, degree, max_weight, seed + 1)]
+
+
+GENERATORS: Dict[str, Callable[..., List[WeightedEdge]]] = {
+    "sparse": sparse,
+    "dense": dense,
+    "grid": grid,
+    "scale_free": scale_free,
+    "negative": negative,
+}
+
+
+def build(backend: str, amount_vertex: int, edges: List[WeightedEdge]):
+    # matrix и csr - направленные графы (для ненаправленных генераторов ребра уже есть в обе стороны),
+    # undirected - те же ребра без направления (при повторе пары остается последний вес)
+    if backend == "csr":
+        return CSRGraph.from_edges((Edge(u, v, w) for u, v, w in edges), is_directed=True,
+                                   vertexes=range(amount_vertex))
+    graph: Graph[int] = Graph[int](is_directed=backend != "undirected")
+    for vertex in range(amount_vertex):
+        graph.add_vertex(vertex)
+    graph.add_edges_from(edges)
+    # Списки соседей строятся при первом обходе: строим их здесь, чтобы все замеры времени и памяти
+    # шли на одинаковом графе, а не первый запуск платил за построение
+    graph.adjacency()
+    return graph
+
+
+def algorithms(family: str, amount_vertex: int, fw_limit: int,
+               backend: str = "matrix") -> Dict[str, Callable[[object], object]]:
+    if backend == "undirected":
+        return mst_algorithms(amount_vertex)
+    last = amount_vertex - 1
+    cases: Dict[str, Callable[[object], object]] = {
+        "bfs": lambda graph: bfs(graph, 0, lambda vertex: False),
+        "bfs_levels": lambda graph: bfs_levels(graph, 0),
+        "dfs": lambda graph: sum(1 for _ in dfs(graph, 0)),
+        "ford_bellman": lambda graph: ford_bellman(graph, 0, last),
+        "ford_bellman_queue": lambda graph: ford_bellman(graph, 0, last, use_queue=True),
+    }
+    if family != "negative":
+        cases["dijkstra"] = lambda graph: dijkstra(graph, 0, last)
+    if amount_vertex <= fw_limit:
+        cases["ford_warshall"] = ford_warshall
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            from ford_warshall_numpy import ford_warshall as ford_warshall_numpy
+            cases["ford_warshall_numpy"] = ford_warshall_numpy
+    return cases
+
+
+def mst_algorithms(amount_vertex: int) -> Dict[str, Callable[[Graph], object]]:
+    # Как Graph.prim и Graph.kruskal в Danil6/graph.py: по матрице ненаправленного графа от вершины 0,
+    # список ребер для Краскала (каждое ребро один раз) собирается в замеряемом вызове
+    return {
+        "prim": lambda graph: prim_lazy(graph.edges, 0),
+        "prim_indexed": lambda graph: prim_indexed(graph.edges, 0),
+        "kruskal": lambda graph: kruskal(amount_vertex, [(i, j, weight) for i, row in enumerate(graph.edges)
+                                                         for j, weight in enumerate(row)
+                                                         if weight is not None and i < j]),
+    }
+
+
+def measure(function: Callable[[], object], repeat: int) -> Dict[str, float]:
+    seconds = timeit.timeit(function, number=repeat)
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": seconds / repeat, "ops_per_sec": repeat / seconds if seconds else float("inf"),
+            "peak_memory_bytes": peak}
+
+
+def run(sizes: List[int], families: List[str], backends: List[str], repeat: int = 3,
+        fw_limit: int = 200, seed: int = 0) -> List[dict]:
+    results: List[dict] = []
+    for family in families:
+        for amount_vertex in sizes:
+            edges = GENERATORS[family](amount_vertex, seed=seed)
+            for backend in backends:
+                graph = build(backend, amount_vertex, edges)
+                for name, algorithm in algorithms(family, amount_vertex, fw_limit, backend).items():
+                    record = {"algorithm": name, "backend": backend, "graph": family,
+                              "vertices": amount_vertex, "edges": len(edges), "repeat": repeat}
+                    record.update(measure(lambda: algorithm(graph), repeat))
+                    results.append(record)
+    return results
+
+
+def compare(previous: List[dict], current: List[dict], threshold: float = 0.1) -> List[str]:
+    # Замеры, у которых ops/sec упал больше чем на threshold относительно прошлого запуска
+    key = lambda record: (record["algorithm"], record["backend"], record["graph"], record["vertices"])
+    old: Dict[tuple, dict] = {key(record): record for record in previous}
+    regressions: List[str] = []
+    for record in current:
+        before: Optional[dict] = old.get(key(record))
+        if before is not None and record["ops_per_sec"] < before["ops_per_sec"] * (1 - threshold):
+            regressions.append(f"{'/'.join(map(str, key(record)))}: "
+                               f"{before['ops_per_sec']:.2f} -> {record['ops_per_sec']:.2f} ops/sec")
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark graph algorithms on synthetic graphs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 400])
+    parser.add_argument("--graphs", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--backends", nargs="+", default=BACKENDS, choices=BACKENDS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--fw-limit", type=int, default=200, help="largest graph for O(V^3) algorithms")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--compare", help="previous JSON results to check for regressions")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.graphs, args.backends, args.repeat, args.fw_limit, args.seed)
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report)
+    else:
+        print(report)
+
+    if args.compare:
+        with open(args.compare) as file:
+            for line in compare(json.load(file), results):
+                print(f"Regression: {line}")
@@ -0,0 +1,107 @@
+"""
+Обход в ширину.
+bfs - обход с остановкой, когда walkfunc вернет True. Вершина помечается посещенной
+в момент постановки в очередь, поэтому каждая попадает в очередь один раз.
+Внутри обход идет по номерам вершин (graph.neighbour_ids), метки нужны только для вызова walkfunc.
+bfs_levels - обход уровнями (frontier) по номерам вершин:
+1) Текущий уровень - массив номеров вершин, посещенные - bytearray (или булев массив NumPy).
+2) Все соседи вершин уровня, которые еще не посещены, образуют следующий уровень.
+Возвращает уровни (число ребер от start, -1 - недостижима) и родителей в дереве обхода (-1 - нет родителя).
+С use_numpy=True соседи всего уровня собираются одной векторной операцией из плоских массивов CSR
+(для графа на матрице они строятся из матрицы); уровни те же, родители могут отличаться, но тоже дают кратчайшие пути.
+"""
+from array import array
+from typing import Callable, Tuple
+
+from csr_graph import CSRGraph
+from graph import T
+
+
+def bfs(graph, start: T, walkfunc: Callable[[T], bool]) -> None:
+    # Очередь - массив номеров с указателем головы: вершины из него не удаляются, каждая попадает в него один раз
+    start_id = graph.index.id_of(start)
+    vertexes = graph.vertexes
+    visited = bytearray(graph.amount_vertexes())
+    visited[start_id] = 1
+    queue = array("q", [start_id])
+    head = 0
+
+    while head < len(queue):
+        vertex = queue[head]
+        head += 1
+
+        if walkfunc(vertexes[vertex]):
+            return
+
+        for finish in graph.neighbour_ids(vertex):
+            if not visited[finish]:
+                visited[finish] = 1
+                queue.append(finish)
+
+
+def bfs_levels(graph, start: T, use_numpy: bool = False) -> Tuple[array, array]:
+    # Возвращает (levels, parents) по номерам вершин: array("q"), с use_numpy - массивы NumPy
+    start_id = graph.index.id_of(start)
+    if use_numpy:
+        return _bfs_levels_numpy(graph, start_id)
+
+    amount_vertex = graph.amount_vertexes()
+    visited = bytearray(amount_vertex)
+    levels = array("q", [-1]) * amount_vertex
+    parents = array("q", [-1]) * amount_vertex
+    visited[start_id] = 1
+    levels[start_id] = 0
+    frontier = array("q", [start_id])
+    level = 0
+
+    while frontier:
+        level += 1
+        next_frontier = array("q")
+        for vertex in frontier:
+            for finish in graph.neighbour_ids(vertex):
+                if not visited[finish]:
+                    visited[finish] = 1
+                    levels[finish] = level
+                    parents[finish] = vertex
+                    next_frontier.append(finish)
+        frontier = next_frontier
+
+    return levels, parents
+
+
+def _bfs_levels_numpy(graph, start_id: int):
+    import numpy as np
+
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    offsets = np.asarray(csr.offsets, dtype=np.int64)
+    targets = np.asarray(csr.targets, dtype=np.int64)
+    amount_vertex = len(offsets) - 1
+
+    visited = np.zeros(amount_vertex, dtype=bool)
+    levels = np.full(amount_vertex, -1, dtype=np.int64)
+    parents = np.full(amount_vertex, -1, dtype=np.int64)
+    visited[start_id] = True
+    levels[start_id] = 0
+    frontier = np.array([start_id], dtype=np.int64)
+    level = 0
+
+    while frontier.size:
+        level += 1
+        # Позиции всех ребер уровня в targets: для каждой вершины диапазон offsets[v]..offsets[v + 1]
+        begins = offsets[frontier]
+        counts = offsets[frontier + 1] - begins
+        total = int(counts.sum())
+        if total == 0:
+            break
+        shifts = np.repeat(begins - (np.cumsum(counts) - counts), counts)
+        finishes = targets[shifts + np.arange(total)]
+        sources = np.repeat(frontier, counts)
+
+        fresh = ~visited[finishes]
+        # Из повторов оставляем первое вхождение - как при последовательном обходе
+        frontier, first = np.unique(finishes[fresh], return_index=True)
+        visited[frontier] = True
+        levels[frontier] = level
+        parents[frontier] = sources[fresh][first]
+
+    return levels, parents
@@ -0,0 +1,97 @@
+"""
+Компоненты сильной связности (алгоритм Тарьяна) и граф конденсации.
+1) Поиск в глубину по номерам вершин на явном стеке; каждой вершине дается номер открытия index и low -
+   наименьший index, достижимый из ее поддерева по одному обратному ребру.
+2) Вершины лежат во втором стеке, пока их компонента не закрыта. Когда у вершины low == index,
+   она - корень компоненты, и все вершины стека до нее снимаются в одну компоненту.
+3) Тарьян закрывает компоненты в обратном топологическом порядке, поэтому номера переворачиваются:
+   в графе конденсации ребра идут от меньшего номера компоненты к большему.
+Граф конденсации - ацикличный граф компонент: ребро c1 -> c2, если есть ребро из вершины c1 в вершину c2.
+reachable помечает вершины, достижимые из start, обходом не вершин, а компонент в графе конденсации.
+Сложность O(V + E) при обходе соседей за O(степень).
+"""
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+
+def strongly_connected_components(graph) -> Tuple[array, int]:
+    # Возвращает (номер компоненты для каждой вершины, количество компонент)
+    amount_vertex = graph.amount_vertexes()
+    order = array("q", [-1]) * amount_vertex  # номер открытия вершины (index)
+    low = array("q", [0]) * amount_vertex
+    on_stack = bytearray(amount_vertex)
+    components = array("q", [-1]) * amount_vertex
+    stack: List[int] = []
+    counter = 0
+    amount_components = 0
+
+    for root in range(amount_vertex):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        calls: List[Tuple[int, Iterator[int]]] = [(root, graph.neighbour_ids(root))]
+
+        while calls:
+            vertex, adjacent = calls[-1]
+            for finish in adjacent:
+                if order[finish] == -1:
+                    order[finish] = low[finish] = counter
+                    counter += 1
+                    stack.append(finish)
+                    on_stack[finish] = 1
+                    calls.append((finish, graph.neighbour_ids(finish)))
+                    break
+                if on_stack[finish] and order[finish] < low[vertex]:
+                    low[vertex] = order[finish]
+            else:
+                calls.pop()
+                if calls and low[vertex] < low[calls[-1][0]]:
+                    low[calls[-1][0]] = low[vertex]
+                if low[vertex] == order[vertex]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        components[member] = amount_components
+                        if member == vertex:
+                            break
+                    amount_components += 1
+
+    # Перенумерация в топологический порядок компонент
+    for vertex in range(amount_vertex):
+        components[vertex] = amount_components - 1 - components[vertex]
+    return components, amount_components
+
+
+def condensation(graph, components: Optional[array] = None,
+                 amount_components: int = 0) -> Tuple[array, List[List[int]]]:
+    # Возвращает (номера компонент вершин, списки смежности графа конденсации без повторов и петель)
+    if components is None:
+        components, amount_components = strongly_connected_components(graph)
+    dag: List[List[int]] = [[] for _ in range(amount_components)]
+    seen = [set() for _ in range(amount_components)]
+
+    for vertex in range(graph.amount_vertexes()):
+        source = components[vertex]
+        for finish in graph.neighbour_ids(vertex):
+            target = components[finish]
+            if target != source and target not in seen[source]:
+                seen[source].add(target)
+                dag[source].append(target)
+    return components, dag
+
+
+def reachable(graph, start: int, condensed: Optional[Tuple[array, List[List[int]]]] = None) -> bytearray:
+    # Вершины, достижимые из start (по номерам): 1 - достижима.
+    # condensed - готовый результат condensation, если запросов из разных вершин много
+    components, dag = condensed if condensed is not None else condensation(graph)
+    marked = bytearray(len(dag))
+    marked[components[start]] = 1
+    # Ребра конденсации идут только к большим номерам, поэтому хватает одного прохода по возрастанию
+    for component in range(components[start], len(dag)):
+        if marked[component]:
+            for target in dag[component]:
+                marked[target] = 1
+    return bytearray(marked[component] for component in components)
@@ -0,0 +1,189 @@
+"""
+Граф в формате CSR (compressed sparse row).
+Вместо матрицы V x V хранятся три массива:
+1) offsets - для вершины i её соседи лежат в диапазоне offsets[i]..offsets[i + 1]
+2) targets - индексы соседей
+3) weights - веса соответствующих ребер
+Память O(V + E), обход соседей вершины - O(степень вершины).
+Граф поддерживает те же обходы (for_each_vertex, for_each_edge, for_each_adjacent_edge, amount_vertexes,
+neighbours, neighbour_ids, neighbour_weights),
+что и Graph, поэтому bfs, ford_bellman и ford_warshall работают с ним без изменений.
+"""
+from array import array
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, Tuple, Dict, Union
+
+from dag import topological_sort
+from dijkstra import dijkstra
+from graph import Graph, T, Edge, AdjacentEdge
+from vertex_index import VertexIndex
+
+
+class CSRGraph(Generic[T]):
+    def __init__(self, index: VertexIndex[T], offsets: array, targets: array, weights: array,
+                 is_directed: bool = False) -> None:
+        self.index: VertexIndex[T] = index
+        self.vertexes: List[T] = index.labels
+        self.offsets: array = offsets
+        self.targets: array = targets
+        self.weights: array = weights
+        self.is_not_directed: bool = not is_directed
+        self._reverse: Optional[Tuple[array, array, array]] = None  # обратный CSR, строится при первом in_neighbours
+        self.source: Optional[Tuple[str, bool]] = None  # (файл, use_numpy), если граф открыт через load_binary
+
+    def __reduce_ex__(self, protocol):
+        # Массивы графа из load_binary смотрят в отображенный файл, и memoryview не сериализуется.
+        # Такой граф передается в другой процесс (пулы ford_bellman_batch и johnson) путем к файлу
+        # и открывается там заново - страницы файла остаются общими, а не копируются
+        if self.source is None:
+            return super().__reduce_ex__(protocol)
+        from graph_file import load_binary
+        return load_binary, self.source
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Edge[T]], is_directed: bool = False,
+                   vertexes: Optional[Iterable[T]] = None) -> 'CSRGraph':
+        # Вершины, которых нет в списке vertexes, добавляются в порядке появления в списке ребер
+        index = VertexIndex[T](vertexes)
+        sources, finishes, weights = array("q"), array("q"), array("q")
+
+        for edge in edges:
+            start = index.add(edge.start_edge)
+            finish = index.add(edge.finish_edge)
+            sources.append(start)
+            finishes.append(finish)
+            weights.append(edge.weight)
+            if not is_directed:
+                sources.append(finish)
+                finishes.append(start)
+                weights.append(edge.weight)
+
+        return cls(index, *_build_csr(len(index), sources, finishes, weights), is_directed=is_directed)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> 'CSRGraph':
+        # Перевод графа на матрице смежности в CSR (строки матрицы уже по порядку вершин)
+        offsets, targets, weights = array("q", [0]), array("q"), array("q")
+        for row in graph.edges:
+            for j, weight in enumerate(row):
+                if weight is not None:
+                    targets.append(j)
+                    weights.append(weight)
+            offsets.append(len(targets))
+        return cls(VertexIndex[T](graph.vertexes), offsets, targets, weights, is_directed=not graph.is_not_directed)
+
+    def amount_vertexes(self) -> int:
+        return len(self.vertexes)
+
+    def is_alive(self, vertex_id: int) -> bool:
+        return True
+
+    def amount_edges(self) -> int:
+        return len(self.targets)
+
+    def for_each_vertex(self, callback: Callable[[T], None]) -> None:
+        for vertex in self.vertexes:
+            callback(vertex)
+
+    def for_each_edge(self, callback: Callable[[Edge[T]], None]) -> None:
+        for i, vertex in enumerate(self.vertexes):
+            for k in range(self.offsets[i], self.offsets[i + 1]):
+                callback(Edge(vertex, self.vertexes[self.targets[k]], self.weights[k]))
+
+    def for_each_adjacent_edge(self, vertex: T, callback: Callable[[AdjacentEdge[T]], None]) -> None:
+        i = self.index.id_of(vertex)
+        for k in range(self.offsets[i], self.offsets[i + 1]):
+            callback(AdjacentEdge(self.vertexes[self.targets[k]], self.weights[k]))
+
+    def neighbours(self, vertex_id: int) -> Iterator[Tuple[int, int]]:
+        # Соседи вершины по номерам: пары (номер соседа, вес)
+        begin, end = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+        return zip(self.targets[begin:end], self.weights[begin:end])
+
+    def neighbour_ids(self, vertex_id: int) -> Iterator[int]:
+        # Номера соседей - срез targets, без пар (номер, вес)
+        return iter(self.targets[self.offsets[vertex_id]:self.offsets[vertex_id + 1]])
+
+    def neighbour_weights(self, vertex_id: int) -> Iterator[int]:
+        return iter(self.weights[self.offsets[vertex_id]:self.offsets[vertex_id + 1]])
+
+    def in_neighbours(self, vertex_id: int) -> Iterator[Tuple[int, int]]:
+        # Входящие ребра по номерам: пары (номер начала ребра, вес).
+        # У ненаправленного графа совпадают с neighbours, у направленного один раз строится транспонированный CSR
+        if self.is_not_directed:
+            return self.neighbours(vertex_id)
+        if self._reverse is None:
+            sources = array("q")
+            for i in range(self.amount_vertexes()):
+                sources.extend([i] * (self.offsets[i + 1] - self.offsets[i]))
+            self._reverse = _build_csr(self.amount_vertexes(), array("q", self.targets), sources,
+                                       array("q", self.weights))
+        offsets, targets, weights = self._reverse
+        begin, end = offsets[vertex_id], offsets[vertex_id + 1]
+        return zip(targets[begin:end], weights[begin:end])
+
+    def topological_sort(self) -> List[T]:
+        return topological_sort(self)
+
+    def dijkstra(self, start: T, end: Optional[T] = None) -> Union[Tuple[List[T], int], Dict[T, int]]:
+        return dijkstra(self, start, end)
+
+    def print_all_vertexes(self) -> None:
+        print("Вершины:\n", ", ".join(map(str, self.vertexes)))
+
+    def print_all_edges(self) -> None:
+        print("Рёбра:\n")
+        self.for_each_edge(lambda edge: print(f"{edge.start_edge} --({edge.weight})--> {edge.finish_edge}"))
+
+
+def _build_csr(amount_vertex: int, sources: array, finishes: array, weights: array) -> tuple[array, array, array]:
+    # Первый проход - подсчет степеней вершин, затем префиксные суммы дают offsets
+    offsets = array("q", bytes(8 * (amount_vertex + 1)))
+    for source in sources:
+        offsets[source + 1] += 1
+    for i in range(amount_vertex):
+        offsets[i + 1] += offsets[i]
+
+    # Второй проход - раскладываем ребра по своим строкам
+    cursor = offsets[:-1]
+    targets = array("q", bytes(8 * len(sources)))
+    csr_weights = array("q", bytes(8 * len(sources)))
+    for source, finish, weight in zip(sources, finishes, weights):
+        position = cursor[source]
+        targets[position] = finish
+        csr_weights[position] = weight
+        cursor[source] = position + 1
+    return offsets, targets, csr_weights
+
+
+if __name__ == '__main__':
+    from fordbellman import ford_bellman
+    from ford_warshall import ford_warshall
+    from bfs import bfs
+
+    edges: list[Edge[str]] = [
+        Edge("A", "B", -3),
+        Edge("B", "A", 4),
+        Edge("B", "C", 5),
+        Edge("B", "F", 7),
+        Edge("C", "E", 1),
+        Edge("C", "A", 6),
+        Edge("E", "B", 5),
+        Edge("E", "F", 6),
+        Edge("F", "A", -4),
+        Edge("F", "C", 8),
+    ]
+
+    graph = CSRGraph.from_edges(edges, is_directed=True)
+    graph.print_all_vertexes()
+    graph.print_all_edges()
+
+    print("\nАлгоритм BFS")
+    bfs(graph, "A", lambda v: print(v, end=' '))
+
+    print("\nАлгоритм Форда-Беллмана")
+    path, cost = ford_bellman(graph, "E", "C")
+    print(f"Path: {path} with cost: {cost}")
+
+    print("\nАлгоритм Флойда-Уоршелла")
+    for key, val in ford_warshall(graph).items():
+        print(f"Key: {key}, Val: {val}")
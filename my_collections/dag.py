@@ -0,0 +1,109 @@
+"""
+Топологическая сортировка и кратчайшие (длиннейшие) пути в ацикличном направленном графе.
+topological_order - алгоритм Кана: вершины с нулевой входящей степенью выписываются в порядок,
+их исходящие ребра удаляются (уменьшаются степени), и так пока вершины не закончатся.
+Если выписаны не все вершины, в графе есть цикл и порядка нет.
+dag_paths - каждое ребро релаксируется ровно один раз в топологическом порядке: к моменту обработки вершины
+все пути в нее уже посчитаны. Сложность O(V + E) вместо O(V * E) у Форда-Беллмана, отрицательные веса допустимы.
+Длиннейший путь считается тем же проходом с обратным сравнением (в графе с циклами эта задача NP-трудная).
+"""
+import math
+from array import array
+from typing import List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def topological_order(graph) -> Optional[array]:
+    # Номера вершин в топологическом порядке; None - в графе есть цикл
+    amount_vertex = graph.amount_vertexes()
+    in_degree = array("q", [0]) * amount_vertex
+    for vertex in range(amount_vertex):
+        for finish in graph.neighbour_ids(vertex):
+            in_degree[finish] += 1
+
+    order = array("q", (vertex for vertex in range(amount_vertex) if in_degree[vertex] == 0))
+    position = 0
+    while position < len(order):
+        vertex = order[position]
+        position += 1
+        for finish in graph.neighbour_ids(vertex):
+            in_degree[finish] -= 1
+            if in_degree[finish] == 0:
+                order.append(finish)
+
+    return order if len(order) == amount_vertex else None
+
+
+def topological_sort(graph) -> List[T]:
+    order = topological_order(graph)
+    if order is None:
+        raise ValueError("Graph contains a cycle")
+    return [graph.vertexes[vertex] for vertex in order if graph.is_alive(vertex)]
+
+
+def dag_paths(graph, start: int, longest: bool = False,
+              order: Optional[array] = None) -> Tuple[List[float], List[int]]:
+    # Стоимости и предки от start по номерам вершин. Недостижимые - inf (для longest -inf), предок -1
+    if order is None:
+        order = topological_order(graph)
+        if order is None:
+            raise ValueError("Graph contains a cycle")
+
+    # Для длиннейшего пути стоимости хранятся со знаком минус, и сравнение остается тем же
+    sign = -1 if longest else 1
+    costs: List[float] = [math.inf] * graph.amount_vertexes()
+    predecessors: List[int] = [-1] * graph.amount_vertexes()
+    costs[start] = 0
+
+    for vertex in order:
+        cost = costs[vertex]
+        if cost == math.inf:
+            continue
+        for finish, weight in graph.neighbours(vertex):
+            new_cost = cost + sign * weight
+            if new_cost < costs[finish]:
+                costs[finish] = new_cost
+                predecessors[finish] = vertex
+
+    if longest:
+        costs = [-cost for cost in costs]
+    return costs, predecessors
+
+
+def dag_path(graph, start: T, end: T, longest: bool = False,
+             order: Optional[array] = None) -> Tuple[List[T], float]:
+    # (путь, стоимость) в формате ford_bellman: если end недостижима - ([end], inf)
+    end_id = graph.index.id_of(end)
+    costs, predecessors = dag_paths(graph, graph.index.id_of(start), longest, order)
+
+    path: List[T] = []
+    vertex = end_id
+    while vertex != -1:
+        path.append(graph.vertexes[vertex])
+        vertex = predecessors[vertex]
+    path.reverse()
+    return path, costs[end_id]
+
+
+if __name__ == '__main__':
+    from graph import Graph
+
+    graph: Graph[str] = Graph[str](is_directed=True)
+    for vertex in "ABCDEF":
+        graph.add_vertex(vertex)
+    graph.add_edge("A", "B", 5)
+    graph.add_edge("A", "C", 3)
+    graph.add_edge("B", "D", 6)
+    graph.add_edge("B", "C", 2)
+    graph.add_edge("C", "E", 4)
+    graph.add_edge("C", "F", 2)
+    graph.add_edge("C", "D", 7)
+    graph.add_edge("D", "E", -1)
+    graph.add_edge("E", "F", -2)
+
+    print(f"Topological order: {graph.topological_sort()}")
+    path, cost = dag_path(graph, "A", "F")
+    print(f"Shortest path: {path} with cost: {cost}")
+    path, cost = dag_path(graph, "A", "F", longest=True)
+    print(f"Longest path: {path} with cost: {cost}")
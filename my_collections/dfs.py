@@ -0,0 +1,90 @@
+"""
+Поиск в глубину на явном стеке вместо рекурсии.
+В стеке лежат пары (вершина, итератор по ее соседям): верхний итератор продвигается на одного соседа,
+непосещенный сосед кладется на стек, а когда соседи закончились, вершина снимается со стека (finish).
+Порядок обхода такой же, как у рекурсивного варианта, но глубина ограничена только памятью,
+поэтому цепочки из миллионов вершин не приводят к RecursionError.
+Обход - генератор: вершины отдаются лениво, и чтобы остановиться, достаточно прервать цикл (break).
+Все состояние живет внутри генератора, поэтому несколько обходов могут идти одновременно, в том числе в разных потоках.
+"""
+from array import array
+from typing import Iterator, List, Tuple, TypeVar, Union
+
+from csr_graph import CSRGraph
+
+T = TypeVar("T")
+
+DISCOVER = "discover"
+FINISH = "finish"
+
+
+def dfs(graph, start: T, events: bool = False) -> Union[Iterator[T], Iterator[Tuple[str, T]]]:
+    # events=False - вершины в порядке открытия, events=True - пары (DISCOVER или FINISH, вершина)
+    for event, vertex_id in dfs_ids(graph, graph.index.id_of(start)):
+        if events:
+            yield event, graph.vertexes[vertex_id]
+        elif event == DISCOVER:
+            yield graph.vertexes[vertex_id]
+
+
+def dfs_ids(graph, start: int) -> Iterator[Tuple[str, int]]:
+    # То же по номерам вершин; соседи берутся через graph.neighbour_ids
+    if isinstance(graph, CSRGraph):
+        yield from _dfs_csr(graph, start)
+        return
+
+    visited = bytearray(graph.amount_vertexes())
+    visited[start] = 1
+    stack: List[Tuple[int, Iterator[int]]] = [(start, graph.neighbour_ids(start))]
+    yield DISCOVER, start
+
+    while stack:
+        vertex, adjacent = stack[-1]
+        for finish in adjacent:
+            if not visited[finish]:
+                visited[finish] = 1
+                stack.append((finish, graph.neighbour_ids(finish)))
+                yield DISCOVER, finish
+                break
+        else:
+            stack.pop()
+            yield FINISH, vertex
+
+
+def _dfs_csr(graph: CSRGraph, start: int) -> Iterator[Tuple[str, int]]:
+    # Для CSR в стеке хранятся не итераторы, а позиции следующего ребра в targets:
+    # миллион живых итераторов заметно замедляет сборщик мусора, а массивы чисел он не просматривает
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.amount_vertexes())
+    visited[start] = 1
+    vertexes = array("q", [start])
+    positions = array("q", [offsets[start]])
+    yield DISCOVER, start
+
+    while vertexes:
+        vertex = vertexes[-1]
+        position, end = positions[-1], offsets[vertex + 1]
+        while position < end and visited[targets[position]]:
+            position += 1
+        if position < end:
+            finish = targets[position]
+            positions[-1] = position + 1
+            visited[finish] = 1
+            vertexes.append(finish)
+            positions.append(offsets[finish])
+            yield DISCOVER, finish
+        else:
+            vertexes.pop()
+            positions.pop()
+            yield FINISH, vertex
+
+
+if __name__ == '__main__':
+    from graph import Graph
+
+    graph: Graph[str] = Graph[str](is_directed=True)
+    graph.load_from_file("graph.txt")
+
+    print(list(dfs(graph, graph.vertexes[0])))
+    for event, vertex in dfs(graph, graph.vertexes[0], events=True):
+        print(event, vertex)
@@ -0,0 +1,72 @@
+"""
+Алгоритм Дейкстры на двоичной куче (только для неотрицательных весов).
+1) Стоимость стартовой вершины 0, остальных - бесконечность, стартовая вершина кладется в кучу.
+2) Из кучи извлекается вершина с минимальной стоимостью, она считается окончательно посчитанной (settled),
+   устаревшие записи в куче пропускаются.
+3) Ребра из нее релаксируются, улучшенные вершины кладутся в кучу.
+4) Если задана конечная вершина, поиск останавливается, как только она извлечена из кучи.
+Сложность O((V + E) log V) при обходе соседей за O(степень).
+"""
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+
+def dijkstra(graph, start: T, end: Optional[T] = None) -> Union[Tuple[List[T], int], Dict[T, int]]:
+    # С end возвращает (путь, стоимость) в формате ford_bellman (и для недостижимой end),
+    # без end - стоимости до всех вершин
+    start_id = graph.index.id_of(start)
+    end_id = graph.index.id_of(end) if end is not None else -1
+    costs, predecessors = shortest_paths(graph, start_id, end_id)
+
+    if end is None:
+        return {graph.vertexes[i]: cost for i, cost in enumerate(costs) if graph.is_alive(i)}
+
+    return restore_path(graph, predecessors, end_id), costs[end_id]
+
+
+def shortest_paths(graph, start: int, end: int = -1,
+                   potential: Optional[List[int]] = None) -> Tuple[List[float], List[int]]:
+    # Работает с номерами вершин, соседи берутся через graph.neighbours.
+    # С potential веса перевзвешиваются: w + potential[u] - potential[v] (алгоритм Джонсона),
+    # возвращаемые стоимости тогда тоже перевзвешенные
+    amount_vertex = graph.amount_vertexes()
+    costs: List[float] = [math.inf] * amount_vertex
+    predecessors: List[int] = [-1] * amount_vertex
+    settled = bytearray(amount_vertex)
+    costs[start] = 0
+    heap: List[Tuple[float, int]] = [(0, start)]
+
+    while heap:
+        cost, vertex = heapq.heappop(heap)
+        if settled[vertex]:
+            continue
+        settled[vertex] = 1
+        if vertex == end:
+            break
+
+        for finish, weight in graph.neighbours(vertex):
+            if potential is not None:
+                weight += potential[vertex] - potential[finish]
+            if weight < 0:
+                raise ValueError("Dijkstra requires non-negative edge weights")
+            new_cost = cost + weight
+            if new_cost < costs[finish]:
+                costs[finish] = new_cost
+                predecessors[finish] = vertex
+                heapq.heappush(heap, (new_cost, finish))
+
+    return costs, predecessors
+
+
+def restore_path(graph, predecessors: List[int], end: int) -> List[T]:
+    # У недостижимой end предка нет, путь - [end]
+    path: List[T] = []
+    vertex = end
+    while vertex != -1:
+        path.append(graph.vertexes[vertex])
+        vertex = predecessors[vertex]
+    path.reverse()
+    return path
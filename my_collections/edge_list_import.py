@@ -0,0 +1,98 @@
+"""
+Потоковый импорт списка ребер (строки "начало конец вес") в двоичный CSR-файл формата graph_file.
+Файл читается кусками по chunk_size байт, ребра целиком в памяти не держатся:
+1) первый проход - нумерация вершин и подсчет исходящей степени каждой вершины;
+2) по степеням считаются offsets, файл сразу создается нужного размера и отображается в память (mmap);
+3) второй проход - каждое ребро пишется в свою строку CSR по курсору этой вершины.
+В памяти только таблица вершин и два массива размера V, поэтому можно загружать списки из сотен миллионов ребер.
+Пустые строки и строки, начинающиеся с "#", пропускаются.
+"""
+import mmap
+import sys
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+from csr_graph import CSRGraph
+from graph_file import write_header, load_binary
+from vertex_index import VertexIndex
+
+
+def import_edge_list(source: str, target: str, is_directed: bool = False, delimiter: Optional[str] = None,
+                     chunk_size: int = 1 << 20, use_numpy: bool = False) -> CSRGraph:
+    if sys.byteorder != "little":
+        raise ValueError("Edge list import writes little-endian arrays in place")
+
+    # Первый проход: номера вершин и степени
+    index = VertexIndex[str]()
+    degrees = array("q")
+    amount_edges = 0
+    for start, finish, _ in _read_edges(source, delimiter, chunk_size):
+        start_id = index.add(start)
+        finish_id = index.add(finish)
+        while len(degrees) < len(index):
+            degrees.append(0)
+        degrees[start_id] += 1
+        amount_edges += 1
+        if not is_directed:
+            degrees[finish_id] += 1
+            amount_edges += 1
+
+    offsets = array("q", [0]) * (len(index) + 1)
+    for i, degree in enumerate(degrees):
+        offsets[i + 1] = offsets[i] + degree
+    del degrees
+
+    with open(target, "w+b") as file:
+        write_header(file, index, is_directed, amount_edges)
+        file.write(offsets.tobytes())
+        targets_begin = file.tell()
+        weights_begin = targets_begin + 8 * amount_edges
+        file.truncate(weights_begin + 8 * amount_edges)
+        file.flush()
+
+        # Второй проход: раскладываем ребра по строкам прямо в отображенный файл
+        with mmap.mmap(file.fileno(), 0) as mapping:
+            memory = memoryview(mapping)
+            targets = memory[targets_begin:weights_begin].cast("q")
+            weights = memory[weights_begin:weights_begin + 8 * amount_edges].cast("q")
+            cursor = offsets[:-1]
+            for start, finish, weight in _read_edges(source, delimiter, chunk_size):
+                start_id = index.id_of(start)
+                finish_id = index.id_of(finish)
+                position = cursor[start_id]
+                targets[position] = finish_id
+                weights[position] = weight
+                cursor[start_id] = position + 1
+                if not is_directed:
+                    position = cursor[finish_id]
+                    targets[position] = start_id
+                    weights[position] = weight
+                    cursor[finish_id] = position + 1
+            targets.release()
+            weights.release()
+            memory.release()
+
+    return load_binary(target, use_numpy)
+
+
+def _read_edges(source: str, delimiter: Optional[str], chunk_size: int) -> Iterator[Tuple[str, str, int]]:
+    with open(source, "r", encoding="utf-8") as file:
+        line_number = 0
+        while True:
+            lines: List[str] = file.readlines(chunk_size)
+            if not lines:
+                return
+            for line in lines:
+                line_number += 1
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                fields = line.split(delimiter)
+                if len(fields) != 3:
+                    raise ValueError(f"{source}:{line_number}: expected 'start finish weight', got {line!r}")
+                try:
+                    weight = int(fields[2])
+                except ValueError:
+                    raise ValueError(f"{source}:{line_number}: weight must be an integer, "
+                                     f"got {fields[2].strip()!r}") from None
+                yield fields[0].strip(), fields[1].strip(), weight
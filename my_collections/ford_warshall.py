@@ -6,49 +6,32 @@
 4) На каждом шаге производим минимизацию значения кратчайшего пути между парами вершин (u, v), присваивая их пересечению в матрице следующее значение min(d[u][v], d[u][k]+d[k][v]),
 где k, u, v = {0, 1, 2, ..., V }
 """
-from graph import Graph, T, AdjacentEdge, Edge
+from graph import Graph, T, Edge
 
 
 def ford_warshall(graph: Graph[T]) -> dict[T, dict[T, int]]:
-    cost_matrix: dict[T, dict[T, int]] = {} #создаем матрицу стоимости
-
-    def vertex_init(vertex: T) -> None:#верхний уровень обход (создаем строку матрицы), движение по смежным ребрам, начиная с вершину, которую передали в функцию
-        cost_matrix[vertex] = {}
-
-        def edge_init(edge: AdjacentEdge[T]) -> None: #заполнение
-            cost_matrix[vertex][edge.finish_edge] = edge.weight
-
-        graph.for_each_adjacent_edge(vertex, edge_init)
-    graph.for_each_vertex(vertex_init)
-
-    for k, _ in graph.vertexes.items():#
-        for u, _ in graph.vertexes.items():
-            for v, _ in graph.vertexes.items():
-                ok = ok1 = ok2 = False
-
-                if u in cost_matrix:
-                    if k in cost_matrix[u]:
-                        ok1 = True
-
-                if k in cost_matrix:
-                    if v in cost_matrix[k]:
-                        ok2 = True
-
-                if not ok1 or not ok2:
-                    continue
-
-                old_cost: int = 0
-                if u in cost_matrix:
-                    if v in cost_matrix[u]:
-                        old_cost = cost_matrix[u][v]
-                        ok = True
-
-                new_cost: int = cost_matrix[u][k] + cost_matrix[k][v]
-                if ok:
-                    if new_cost < old_cost:
-                        cost_matrix[u][v] = new_cost
-                else:
-                    cost_matrix[u][v] = new_cost
+    # Строка матрицы стоимости - словарь только по существующим путям: отсутствующий ключ означает "пути нет".
+    # Строки заполняются прямо из списков соседей графа (neighbours по номерам), без обратного вызова на каждое ребро
+    vertexes: list[T] = []
+    graph.for_each_vertex(vertexes.append)
+    cost_matrix: dict[T, dict[T, int]] = {}
+    for vertex in vertexes:
+        vertex_id = graph.index.id_of(vertex)
+        cost_matrix[vertex] = {graph.vertexes[finish]: weight for finish, weight in graph.neighbours(vertex_id)}
+
+    for k in vertexes:
+        row_k = cost_matrix[k]
+        # Перебираются только пары с путями u -> k и k -> v, остальные ячейки не меняются
+        through_k = list(row_k.items())
+        for row_u in cost_matrix.values():
+            cost_uk = row_u.get(k)
+            if cost_uk is None:
+                continue
+            for v, cost_kv in through_k:
+                new_cost = cost_uk + cost_kv
+                old_cost = row_u.get(v)
+                if old_cost is None or new_cost < old_cost:
+                    row_u[v] = new_cost
 
     return cost_matrix
 
@@ -0,0 +1,113 @@
+"""
+Блочный (tiled) алгоритм Флойда-Уоршелла для больших матриц.
+Матрица V x V делится на квадратные блоки размера block_size, для каждого блока-"диагонали" kb:
+1) пересчитывается диагональный блок (kb, kb) обычным Флойдом-Уоршеллом по своим k;
+2) пересчитываются блоки строки kb и столбца kb - они зависят только от себя и от диагонального блока;
+3) пересчитываются все остальные блоки (i, j) через уже готовые блоки (i, kb) и (kb, j).
+Блоки одной фазы независимы, поэтому фазы 2 и 3 раздаются пулу процессов.
+Матрица лежит в разделяемой памяти (shared_memory), процессы пишут в свои блоки без копирования.
+Блок целиком помещается в кэш, поэтому даже в одном процессе это быстрее построчного варианта.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ford_warshall_numpy import cost_matrix
+
+# (начало строк, конец строк, начало столбцов, конец столбцов, начало k, конец k)
+Tile = Tuple[int, int, int, int, int, int]
+
+_matrix: Optional[np.ndarray] = None
+_shared: Optional[shared_memory.SharedMemory] = None
+
+
+def _update_tile(matrix: np.ndarray, tile: Tile) -> None:
+    row_begin, row_end, col_begin, col_end, k_begin, k_end = tile
+    block = matrix[row_begin:row_end, col_begin:col_end]
+    for k in range(k_begin, k_end):
+        np.minimum(block, matrix[row_begin:row_end, k, None] + matrix[None, k, col_begin:col_end], out=block)
+
+
+def _init_worker(name: str, amount_vertex: int) -> None:
+    # Каждый процесс пула один раз подключается к общей матрице
+    global _matrix, _shared
+    _shared = shared_memory.SharedMemory(name=name)
+    _matrix = np.ndarray((amount_vertex, amount_vertex), dtype=np.float64, buffer=_shared.buf)
+
+
+def _update_tiles(tiles: List[Tile]) -> None:
+    for tile in tiles:
+        _update_tile(_matrix, tile)
+
+
+def _run_phase(matrix: np.ndarray, tiles: List[Tile], pool: Optional[ProcessPoolExecutor], workers: int) -> None:
+    if pool is None or len(tiles) == 1:
+        for tile in tiles:
+            _update_tile(matrix, tile)
+        return
+    # Блоки раздаются пачками, чтобы не платить за пересылку задачи на каждый блок
+    chunks = [tiles[i::workers] for i in range(workers)]
+    for future in [pool.submit(_update_tiles, chunk) for chunk in chunks if chunk]:
+        future.result()
+
+
+def ford_warshall_blocked(costs: np.ndarray, block_size: int = 256, workers: Optional[int] = None) -> np.ndarray:
+    # Возвращает новую матрицу кратчайших расстояний, исходная не меняется
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    amount_vertex = costs.shape[0]
+    workers = workers or os.cpu_count() or 1
+    bounds = [(begin, min(begin + block_size, amount_vertex)) for begin in range(0, amount_vertex, block_size)]
+
+    if workers == 1 or len(bounds) == 1:
+        matrix = np.array(costs, dtype=np.float64)
+        _run_blocks(matrix, bounds, None, 1)
+        return matrix
+
+    shared = shared_memory.SharedMemory(create=True, size=max(costs.size, 1) * 8)
+    try:
+        matrix = np.ndarray((amount_vertex, amount_vertex), dtype=np.float64, buffer=shared.buf)
+        matrix[:] = costs
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shared.name, amount_vertex)) as pool:
+            _run_blocks(matrix, bounds, pool, workers)
+        result = matrix.copy()
+        del matrix
+    finally:
+        shared.close()
+        shared.unlink()
+    return result
+
+
+def _run_blocks(matrix: np.ndarray, bounds: List[Tuple[int, int]], pool: Optional[ProcessPoolExecutor],
+                workers: int) -> None:
+    for k_begin, k_end in bounds:
+        # Фаза 1 - диагональный блок
+        _update_tile(matrix, (k_begin, k_end, k_begin, k_end, k_begin, k_end))
+
+        # Фаза 2 - блоки строки и столбца kb
+        phase2: List[Tile] = []
+        for begin, end in bounds:
+            if begin != k_begin:
+                phase2.append((k_begin, k_end, begin, end, k_begin, k_end))
+                phase2.append((begin, end, k_begin, k_end, k_begin, k_end))
+        if phase2:
+            _run_phase(matrix, phase2, pool, workers)
+
+        # Фаза 3 - остальные блоки
+        phase3: List[Tile] = [
+            (row_begin, row_end, col_begin, col_end, k_begin, k_end)
+            for row_begin, row_end in bounds if row_begin != k_begin
+            for col_begin, col_end in bounds if col_begin != k_begin
+        ]
+        if phase3:
+            _run_phase(matrix, phase3, pool, workers)
+
+
+def ford_warshall(graph, block_size: int = 256, workers: Optional[int] = None) -> List[List[int]]:
+    costs = ford_warshall_blocked(cost_matrix(graph), block_size, workers)
+    return [[math.inf if cost == math.inf else int(cost) for cost in row] for row in costs.tolist()]
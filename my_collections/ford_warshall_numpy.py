@@ -0,0 +1,56 @@
+"""
+Алгоритм Флойда-Уоршелла на NumPy.
+Матрица стоимостей хранится как float64 (inf - нет пути), и каждый шаг k делается одной векторной операцией
+D = min(D, D[:, k] + D[k, :]) вместо двух вложенных циклов Python по i и j.
+Результат ford_warshall совпадает по форме с Graph.ford_warshall: список строк V x V.
+ford_warshall_paths дополнительно ведет матрицу следующего шага и возвращает AllPairs для восстановления путей.
+"""
+import math
+from typing import List
+
+import numpy as np
+
+from all_pairs import AllPairs
+
+
+def cost_matrix(graph) -> np.ndarray:
+    # Начальная матрица по ребрам графа; из параллельных ребер берется самое легкое
+    amount_vertex = graph.amount_vertexes()
+    costs = np.full((amount_vertex, amount_vertex), np.inf)
+    sources: List[int] = []
+    finishes: List[int] = []
+    weights: List[int] = []
+    for i in range(amount_vertex):
+        for j, weight in graph.neighbours(i):
+            sources.append(i)
+            finishes.append(j)
+            weights.append(weight)
+    np.minimum.at(costs, (np.array(sources, dtype=np.intp), np.array(finishes, dtype=np.intp)),
+                  np.array(weights, dtype=np.float64))
+    return costs
+
+
+def ford_warshall_matrix(costs: np.ndarray) -> np.ndarray:
+    # Пересчитывает матрицу на месте и возвращает ее же
+    for k in range(costs.shape[0]):
+        np.minimum(costs, costs[:, k, None] + costs[None, k, :], out=costs)
+    return costs
+
+
+def ford_warshall(graph) -> List[List[int]]:
+    costs = ford_warshall_matrix(cost_matrix(graph))
+    return [[math.inf if cost == math.inf else int(cost) for cost in row] for row in costs.tolist()]
+
+
+def ford_warshall_paths(graph) -> AllPairs:
+    costs = cost_matrix(graph)
+    amount_vertex = costs.shape[0]
+    next_hop = np.where(np.isfinite(costs), np.arange(amount_vertex)[None, :], -1)
+    for k in range(amount_vertex):
+        through_k = costs[:, k, None] + costs[None, k, :]
+        better = through_k < costs
+        np.copyto(costs, through_k, where=better)
+        np.copyto(next_hop, np.broadcast_to(next_hop[:, k, None], next_hop.shape), where=better)
+
+    cost_rows = [[math.inf if cost == math.inf else int(cost) for cost in row] for row in costs.tolist()]
+    return AllPairs(graph.index, cost_rows, next_hop.ravel())
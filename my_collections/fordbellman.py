@@ -1,56 +1,278 @@
 import math
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Generic, Optional
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, Union
 
+from components import condensation, reachable
+from dag import dag_path, dag_paths, topological_order
 from graph import Graph, T, Edge
+from set import Queue
+
 
 @dataclass
-class _Node(Generic[T]):#Создаем узел
+class NegativeCycle(Generic[T]):
+    vertexes: List[T]  # вершины цикла по порядку ребер, первая повторяется в конце
     cost: int
-    predecessor: Optional[T]
 
 
-def ford_bellman(graph: Graph[T], start: T, end: T) -> tuple[list[T], int]: #
-    nodes: dict[T, _Node[T]] = {} #создается словарь
+def ford_bellman(graph: Graph[T], start: T, end: T, use_queue: bool = False,
+                 detect_cycle: bool = False) -> Union[Tuple[List[T], int], NegativeCycle[T]]: #
+    # Формат (путь, стоимость) общий для поиска пути между двумя вершинами (dijkstra, dag_path, a_star):
+    # путь от start до end включительно; если end недостижима - ([end], inf).
+    # Если из start достижим отрицательный цикл, кратчайшего пути нет: результат ([], 0),
+    # а с detect_cycle=True - сам цикл (NegativeCycle), найденный find_negative_cycle
+    order = topological_order(graph)
+    if order is not None:
+        # Граф ацикличный: каждое ребро релаксируется один раз в топологическом порядке, O(V + E)
+        return dag_path(graph, start, end, order=order)
+
+    # Стоимости и предки хранятся в списках по номерам вершин, соседи берутся по номерам (graph.neighbours)
+    start_id = graph.index.id_of(start)
+    end_id = graph.index.id_of(end)
+    costs: List[float] = [math.inf] * graph.amount_vertexes()
+    predecessors: List[int] = [-1] * graph.amount_vertexes()
+    costs[start_id] = 0 #первая стартовая вершина значение 0
+
+    # Недостижимые из start вершины (по компонентам сильной связности) не влияют на ответ:
+    # их ребра не релаксируются, а число проходов ограничено количеством достижимых вершин
+    marked = reachable(graph, start_id)
+    amount_vertex = sum(marked) #количество вершин понадобится для следующего образа (каждый шаг алгоритма начинается с полного обхода всего)
+
+    if use_queue:
+        has_negative_loop = _relax_by_queue(graph, costs, predecessors, start_id, amount_vertex)
+    else:
+        edges = [(i, j, weight) for i in range(graph.amount_vertexes()) if marked[i]
+                 for j, weight in graph.neighbours(i)]
+        has_negative_loop = _relax_by_passes(edges, costs, predecessors, amount_vertex)
+
+    if has_negative_loop:
+        return find_negative_cycle(graph, start) if detect_cycle else ([], 0)
+
+    vertex = end_id
+    path: list[T] = []
+    while vertex != -1:
+        path.append(graph.vertexes[vertex])
+        vertex = predecessors[vertex]
+    path.reverse()
+    return path, costs[end_id]
+
+
+def find_negative_cycle(graph: Graph[T], start: Optional[T] = None) -> Optional[NegativeCycle[T]]:
+    # Поиск отрицательного цикла, достижимого из start (без start - любого цикла в графе).
+    # После каждого прохода граф предков проверяется на цикл за O(V): цикл в нем всегда отрицательный,
+    # поэтому сильный цикл находится за несколько проходов, а не за V. Если ребро релаксируется в проходе V,
+    # поиск тоже сразу останавливается, и цикл достается из цепочки предков. None - отрицательных циклов нет
+    amount_vertex = graph.amount_vertexes()
+    predecessors: List[int] = [-1] * amount_vertex
+    through: List[int] = [0] * amount_vertex  # вес ребра из предка (параллельные ребра могут иметь разные веса)
+    if start is None:
+        # Все стоимости 0 - как от фиктивной вершины, связанной со всеми ребрами веса 0
+        costs: List[float] = [0] * amount_vertex
+        edges = [(i, j, weight) for i in range(amount_vertex) for j, weight in graph.neighbours(i)]
+    else:
+        start_id = graph.index.id_of(start)
+        marked = reachable(graph, start_id)
+        costs = [math.inf] * amount_vertex
+        costs[start_id] = 0
+        edges = [(i, j, weight) for i in range(amount_vertex) if marked[i] for j, weight in graph.neighbours(i)]
+
+    for pass_number in range(amount_vertex):
+        changed = False
+        for i, j, weight in edges:
+            new_cost = costs[i] + weight
+            if new_cost < costs[j]:
+                costs[j] = new_cost
+                predecessors[j] = i
+                through[j] = weight
+                changed = True
+                if pass_number == amount_vertex - 1:
+                    # После V шагов по предкам вершина гарантированно лежит на цикле
+                    for _ in range(amount_vertex):
+                        j = predecessors[j]
+                    return _extract_cycle(graph, predecessors, through, j)
+        if not changed:
+            return None
+        vertex = _predecessor_cycle(predecessors)
+        if vertex != -1:
+            return _extract_cycle(graph, predecessors, through, vertex)
+    return None
+
+
+def _predecessor_cycle(predecessors: List[int]) -> int:
+    # Вершина на цикле графа предков или -1. Из каждой вершины идем по предкам, помечая вершины номером обхода:
+    # встретили метку текущего обхода - нашли цикл, метку прошлого обхода или -1 - цикла на этом пути нет
+    walks = array("q", [-1]) * len(predecessors)
+    for first in range(len(predecessors)):
+        vertex = first
+        while vertex != -1 and walks[vertex] == -1:
+            walks[vertex] = first
+            vertex = predecessors[vertex]
+        if vertex != -1 and walks[vertex] == first:
+            return vertex
+    return -1
+
+
+def _extract_cycle(graph: Graph[T], predecessors: List[int], through: List[int], vertex: int) -> NegativeCycle[T]:
+    # vertex лежит на цикле предков: идем по предкам, пока не вернемся в нее
+    cycle = [vertex]
+    cost = through[vertex]
+    current = predecessors[vertex]
+    while current != vertex:
+        cycle.append(current)
+        cost += through[current]
+        current = predecessors[current]
+    cycle.append(vertex)
+    cycle.reverse()
+    return NegativeCycle([graph.vertexes[i] for i in cycle], cost)
+
+
+def ford_bellman_batch(graph: Graph[T], queries: Iterable[Tuple[T, T]], workers: Optional[int] = None,
+                       detect_cycle: bool = False) -> List[Union[Tuple[List[T], int], NegativeCycle[T]]]:
+    # Много запросов (start, end): стоимости и предки считаются один раз на каждую стартовую вершину,
+    # стартовые вершины можно раздать пулу процессов. Результаты - в порядке запросов, в формате ford_bellman
+    # (с detect_cycle - цикл вместо ([], 0), один на стартовую вершину)
+    queries = [(graph.index.id_of(start), graph.index.id_of(end)) for start, end in queries]
+    sources = list(dict.fromkeys(start for start, _ in queries))
+
+    # Топологический порядок или конденсация считаются один раз на весь пакет
+    order = topological_order(graph)
+    condensed = condensation(graph) if order is None else None
 
-    def foreach(vertex: T) -> None:#метод обхода (нужно обойти все вершины, сформировать словарь и в качестве стоимости присвоить бесконечность)
-        nodes[vertex] = _Node[T](math.inf, None)
+    if workers is None or workers <= 1:
+        rows = [shortest_paths(graph, source, order, condensed) for source in sources]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(graph, order, condensed)) as pool:
+            rows = list(pool.map(_worker_shortest_paths, sources, chunksize=max(1, len(sources) // (4 * workers))))
+    by_source = dict(zip(sources, rows))
 
-    graph.for_each_vertex(foreach)
-    nodes[start].cost = 0 #первая стартовая вершина значение 0
+    results: List[Union[Tuple[List[T], int], NegativeCycle[T]]] = []
+    cycles: Dict[int, NegativeCycle[T]] = {}
+    for start, end in queries:
+        row = by_source[start]
+        if row is None:
+            if not detect_cycle:
+                results.append(([], 0))
+                continue
+            if start not in cycles:
+                cycles[start] = find_negative_cycle(graph, graph.vertexes[start])
+            results.append(cycles[start])
+            continue
+        costs, predecessors = row
+        path: List[T] = []
+        vertex = end
+        while vertex != -1:
+            path.append(graph.vertexes[vertex])
+            vertex = predecessors[vertex]
+        path.reverse()
+        results.append((path, costs[end]))
+    return results
 
-    amount_vertex = graph.amount_vertexes() #количество вершин понадобится для следующего образа (каждый шаг алгоритма начинается с полного обхода всего)
 
-    def calc(edge: Edge[T]) -> None:#
-        cost = nodes[edge.start_edge].cost + edge.weight#высчитываем стоимость движения по ребрам
-        if cost < nodes[edge.finish_edge].cost:#смотрим она меньше существуещей или не меньше
-            nodes[edge.finish_edge].cost = cost
-            vertex = edge.start_edge
-            nodes[edge.finish_edge].predecessor = vertex#присваем сыллку на нужную вершину
+def shortest_paths(graph: Graph[T], start: int, order: Optional[array] = None,
+                   condensed=None) -> Optional[Tuple[List[float], List[int]]]:
+    # Стоимости и предки (-1 - нет) от start по номерам вершин; None - из start достижим отрицательный цикл.
+    # order - топологический порядок, если граф ацикличный; condensed - готовый результат condensation
+    if order is not None:
+        return dag_paths(graph, start, order=order)
 
-    for i in range(0, amount_vertex - 1):
-        graph.for_each_edge(calc)
+    marked = reachable(graph, start, condensed)
+    edges = [(i, j, weight) for i in range(graph.amount_vertexes()) if marked[i] for j, weight in graph.neighbours(i)]
+    costs: List[float] = [math.inf] * graph.amount_vertexes()
+    predecessors: List[int] = [-1] * graph.amount_vertexes()
+    costs[start] = 0
+
+    if _relax_by_passes(edges, costs, predecessors, sum(marked)):
+        return None
+    return costs, predecessors
+
+
+_graph = None
+_order: Optional[array] = None
+_condensed = None
+
+
+def _init_worker(graph: Graph[T], order: Optional[array], condensed) -> None:
+    # Граф передается в процесс один раз, а не с каждой стартовой вершиной
+    global _graph, _order, _condensed
+    _graph = graph
+    _order = order
+    _condensed = condensed
+
+
+def _worker_shortest_paths(source: int) -> Optional[Tuple[List[float], List[int]]]:
+    return shortest_paths(_graph, source, _order, _condensed)
+
+
+def potentials(graph: Graph[T]) -> Optional[dict[T, int]]:
+    # Стоимости от фиктивной вершины, связанной со всеми вершинами ребрами веса 0 (перевзвешивание Джонсона).
+    # None - в графе есть отрицательный цикл
+    costs = potentials_by_id(graph)
+    if costs is None:
+        return None
+    vertexes: List[T] = []
+    graph.for_each_vertex(vertexes.append)
+    return {vertex: costs[graph.index.id_of(vertex)] for vertex in vertexes}
+
+
+def potentials_by_id(graph: Graph[T]) -> Optional[List[int]]:
+    # То же списком по номерам вершин. Фиктивная вершина равносильна нулевой начальной стоимости
+    # у всех вершин и одному лишнему проходу
+    amount_vertex = graph.amount_vertexes()
+    costs: List[float] = [0] * amount_vertex
+    edges = [(i, j, weight) for i in range(amount_vertex) for j, weight in graph.neighbours(i)]
+    if _relax_by_passes(edges, costs, [-1] * amount_vertex, amount_vertex + 1):
+        return None
+    return costs
+
+
+def _relax_by_passes(edges: List[Tuple[int, int, int]], costs: List[float], predecessors: List[int],
+                     amount_vertex: int) -> bool:
+    # Ребра (начало, конец, вес) по номерам собраны в список заранее: проход по нему не зависит
+    # от представления графа (у матрицы это O(V^2)). True - есть отрицательный цикл
+    for _ in range(0, amount_vertex - 1):
+        changed = False
+        for i, j, weight in edges:
+            new_cost = costs[i] + weight#высчитываем стоимость движения по ребрам
+            if new_cost < costs[j]:#смотрим она меньше существуещей или не меньше
+                costs[j] = new_cost
+                predecessors[j] = i#присваем сыллку на нужную вершину
+                changed = True
+        if not changed:#проход ничего не изменил - стоимости окончательные, отрицательного цикла нет
+            return False
 
     # проверка на наличие отрицательного (негативного) цикла
-    has_negative_loop = False
+    return any(costs[i] + weight < costs[j] for i, j, weight in edges)
 
-    def negative_search(edge: Edge[T]) -> None:
-        nonlocal has_negative_loop
-        if (nodes[edge.start_edge].cost + edge.weight <
-                nodes[edge.finish_edge].cost):
-            has_negative_loop = True
-    graph.for_each_edge(negative_search)
 
-    if has_negative_loop:
-        return [], 0
+def _relax_by_queue(graph: Graph[T], costs: List[float], predecessors: List[int], start: int,
+                    amount_vertex: int) -> bool:
+    # Очередь вершин, чья стоимость улучшилась: релаксируются только ребра из них (SPFA).
+    # В lengths - число ребер в текущем лучшем пути; путь из amount_vertex ребер означает отрицательный цикл
+    queue = Queue[int]()
+    in_queue = bytearray(graph.amount_vertexes())
+    lengths = array("q", [0]) * graph.amount_vertexes()
+    in_queue[start] = 1
+    queue.enqueue(start)
 
-    vertex: Optional[T] = end
-    path: list[T] = []
-    while vertex is not None:
-        path.append(vertex)
-        vertex = nodes[vertex].predecessor
-    path.reverse()
-    return path, nodes[end].cost
+    while not queue.is_empty():
+        vertex = queue.dequeue()
+        in_queue[vertex] = 0
+        cost = costs[vertex]
+        for finish, weight in graph.neighbours(vertex):
+            new_cost = cost + weight
+            if new_cost < costs[finish]:
+                costs[finish] = new_cost
+                predecessors[finish] = vertex
+                lengths[finish] = lengths[vertex] + 1
+                if lengths[finish] >= amount_vertex:
+                    return True
+                if not in_queue[finish]:
+                    in_queue[finish] = 1
+                    queue.enqueue(finish)
+
+    return False
 
 
 if __name__ == '__main__':
@@ -69,6 +291,8 @@ if __name__ == '__main__':
 
     graph: Graph[str] = Graph[str](is_directed=True) #True = направленный
 
+    for vertex in "ABCEF":
+        graph.add_vertex(vertex)
     for it in vertexes:
         graph.add_edge(it.start_edge, it.finish_edge, it.weight)
 
@@ -79,4 +303,8 @@ if __name__ == '__main__':
     print(f"Path: {path} with cost: {cost}")
 
     path, cost = ford_bellman(graph, "A", "E")
-    print(f"Path: {path} with cost: {cost}")
\ No newline at end of file
+    print(f"Path: {path} with cost: {cost}")
+
+    graph.add_edge("E", "C", -10)  # цикл C -> E -> C с весом -9
+    print(ford_bellman(graph, "A", "E"))
+    print(ford_bellman(graph, "A", "E", detect_cycle=True))
\ No newline at end of file
@@ -1,85 +1,384 @@
+from bisect import bisect_left
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import TypeVar, List, Optional, Tuple
+from typing import TypeVar, List, Optional, Tuple, Callable, Generic, Iterable, Iterator, Dict, Union
 import math
 import timeit
 
+from all_pairs import AllPairs, ford_warshall_paths
+from components import reachable
+from dag import dag_paths, topological_order, topological_sort
+from dijkstra import dijkstra
+from vertex_index import VertexIndex
+
 T = TypeVar("T")
+R = TypeVar("R")
 
 @dataclass
 class _Node:
     cost: int
     predecessor: Optional[T]
 
-class Graph:
-    def __init__(self, is_directed: bool = False) -> None:
-        # Список вершин графа
-        self.vertexes: List[T] = []
+@dataclass
+class Edge(Generic[T]):
+    start_edge: T
+    finish_edge: T
+    weight: int = 0
+
+@dataclass
+class AdjacentEdge(Generic[T]):
+    finish_edge: T
+    weight: int = 0
+
+    def __hash__(self) -> int:
+        return hash((self.finish_edge, self.weight))
+
+class Graph(Generic[T]):
+    def __init__(self, is_directed: bool = False, cache_size: int = 0) -> None:
+        # Номера вершин (вершина <-> индекс строки матрицы)
+        self.index: VertexIndex[T] = VertexIndex[T]()
+        # Список вершин графа (в порядке номеров)
+        self.vertexes: List[T] = self.index.labels
         # Матрица смежности (веса ребер между вершинами)
         self.edges: List[List[Optional[int]]] = []
         # Флаг для определения направленности графа
         self.is_not_directed: bool = not is_directed
+        # Сохраненный результат Флойда-Уоршелла, обновляется при добавлении ребер (см. all_pairs)
+        self._all_pairs: Optional[AllPairs[T]] = None
+        # Версия графа растет при каждом изменении; cache_size > 0 включает LRU-кэш результатов (см. _cached)
+        self._version: int = 0
+        self._cache_size: int = cache_size
+        self._cache: Optional[OrderedDict] = OrderedDict() if cache_size > 0 else None
+        # Соседи по строкам матрицы (см. adjacency); None - еще не построены
+        self._rows: Optional[Tuple[List[List[int]], List[List[int]]]] = None
 
     def add_vertex(self, vertex: T) -> None:
         # Добавление новой вершины
-        if vertex not in self.vertexes:
+        if vertex not in self.index:
             # Добавляем вершину в список вершин
-            self.vertexes.append(vertex)
+            self.index.add(vertex)
             # Добавляем новый столбец в матрицу смежности
             for row in self.edges:
                 row.append(None)
             # Добавляем новую строку в матрицу смежности
             self.edges.append([None] * len(self.vertexes))
+            if self._rows is not None:
+                self._rows[0].append([])
+                self._rows[1].append([])
+            self._version += 1
+            if self._all_pairs is not None:
+                self._all_pairs.add_vertex()
 
     def add_edge(self, vertex1: T, vertex2: T, weight: int) -> None:
         # Добавление ребра между вершинами с указанным весом
-        if vertex1 not in self.vertexes or vertex2 not in self.vertexes:
+        if vertex1 not in self.index or vertex2 not in self.index:
             # Проверка наличия обеих вершин в графе
             raise ValueError("Both vertices must be in the graph")
 
-        index1 = self.vertexes.index(vertex1)
-        index2 = self.vertexes.index(vertex2)
-
-        # Установка веса ребра в матрице смежности
-        self.edges[index1][index2] = weight
+        index1 = self.index.id_of(vertex1)
+        index2 = self.index.id_of(vertex2)
+        self._write_edges([index1], [index2], [weight])
+
+    def remove_edge(self, vertex1: T, vertex2: T) -> None:
+        # Удаление ребра может только удлинить пути, поэтому сохраненные пути сбрасываются
+        index1 = self.index.id_of(vertex1)
+        index2 = self.index.id_of(vertex2)
+        if self.edges[index1][index2] is None:
+            raise ValueError(f"Edge {vertex1} -> {vertex2} is not in the graph")
+        self.edges[index1][index2] = None
+        self._set_in_rows(index1, index2, None)
         if self.is_not_directed:
-            # Если граф ненаправленный, установка веса в зеркальной ячейке
-            self.edges[index2][index1] = weight
-
-    def ford_bellman(self, start: T, end: T) -> Tuple[List[T], int]:
-        # Алгоритм Форда-Беллмана для поиска кратчайшего пути
-        nodes = {vertex: _Node(float('inf'), None) for vertex in self.vertexes}
-        start_index = self.vertexes.index(start)
-        nodes[start].cost = 0
-
-        for _ in range(len(self.vertexes) - 1):
-            for i in range(len(self.vertexes)):
-                for j in range(len(self.vertexes)):
-                    if self.edges[i][j] is not None:
-                        new_cost = nodes[self.vertexes[i]].cost + self.edges[i][j]
-                        if new_cost < nodes[self.vertexes[j]].cost:
-                            nodes[self.vertexes[j]].cost = new_cost
-                            nodes[self.vertexes[j]].predecessor = self.vertexes[i]
-
-        has_negative_loop = any(
-            nodes[self.vertexes[i]].cost + self.edges[i][j] < nodes[self.vertexes[j]].cost
-            for i in range(len(self.vertexes))
-            for j in range(len(self.vertexes))
-            if self.edges[i][j] is not None
-        )
-
-        if has_negative_loop:
-            return [], 0
-
-        vertex = end
+            self.edges[index2][index1] = None
+            self._set_in_rows(index2, index1, None)
+        self._all_pairs = None
+        self._version += 1
+
+    def remove_vertex(self, vertex: T) -> None:
+        # Строка и столбец убираются из матрицы за O(V), номера следующих вершин сдвигаются на один.
+        # Для частых удалений - AdjacencyListGraph (adjacency_graph.py)
+        vertex_id = self.index.id_of(vertex)
+        del self.edges[vertex_id]
+        for row in self.edges:
+            del row[vertex_id]
+        if self._rows is not None:
+            # Из списков соседей убирается сама вершина, номера следующих за ней уменьшаются на один
+            targets, weights = self._rows
+            del targets[vertex_id], weights[vertex_id]
+            for ids, row_weights in zip(targets, weights):
+                position = bisect_left(ids, vertex_id)
+                if position < len(ids) and ids[position] == vertex_id:
+                    del ids[position], row_weights[position]
+                for k in range(position, len(ids)):
+                    ids[k] -= 1
+        self.index = VertexIndex[T](label for i, label in enumerate(self.vertexes) if i != vertex_id)
+        self.vertexes = self.index.labels
+        self._all_pairs = None
+        self._version += 1
+
+    def add_edges_from(self, edges: Iterable[Union[Edge[T], Tuple[T, T, int]]]) -> None:
+        # Пакетное добавление ребер (Edge или кортежи (начало, конец, вес)).
+        # Сначала все вершины переводятся в номера, и только потом пишется матрица:
+        # если какой-то вершины нет в графе, ValueError и граф не меняется
+        id_of = self.index.id_of
+        starts: List[int] = []
+        finishes: List[int] = []
+        weights: List[int] = []
+        for edge in edges:
+            if isinstance(edge, Edge):
+                start, finish, weight = edge.start_edge, edge.finish_edge, edge.weight
+            else:
+                start, finish, weight = edge
+            starts.append(id_of(start))
+            finishes.append(id_of(finish))
+            weights.append(weight)
+        self._write_edges(starts, finishes, weights)
+
+    def add_edges_from_arrays(self, src, dst, weight) -> None:
+        # То же для трех массивов одной длины (списки, array или массивы NumPy): начала, концы и веса.
+        # Каждая различная вершина ищется в индексе один раз на весь пакет
+        if not len(src) == len(dst) == len(weight):
+            raise ValueError("src, dst and weight must have the same length")
+
+        if hasattr(src, "dtype") and hasattr(dst, "dtype"):
+            # Массивы NumPy: различные метки и обратное отображение одной операцией
+            import numpy as np
+            labels, inverse = np.unique(np.concatenate((src, dst)), return_inverse=True)
+            lookup = np.array([self.index.id_of(label) for label in labels.tolist()], dtype=np.int64)
+            ids = lookup[inverse]
+            starts, finishes = ids[:len(src)].tolist(), ids[len(src):].tolist()
+        else:
+            ids = {vertex: self.index.id_of(vertex) for vertex in set(src).union(dst)}
+            starts, finishes = [ids[vertex] for vertex in src], [ids[vertex] for vertex in dst]
+        # Веса переводятся в числа Python, чтобы в матрицу не попадали numpy.int64
+        self._write_edges(starts, finishes, weight.tolist() if hasattr(weight, "tolist") else weight)
+
+    def _write_edges(self, starts: List[int], finishes: List[int], weights: List[int]) -> None:
+        # Запись ребер (номера начал, номера концов, веса) в матрицу смежности одним проходом
+        edges = self.edges
+        # Сохраненные пути обновляются за O(V^2) на ребро; для пакета больше V ребер дешевле пересчитать их заново
+        if len(starts) > len(self.vertexes):
+            self._all_pairs = None
+
+        if self._all_pairs is None:
+            # Без сохраненных путей - только запись весов, без чтения старых
+            if self.is_not_directed:
+                for index1, index2, weight in zip(starts, finishes, weights):
+                    edges[index1][index2] = weight
+                    edges[index2][index1] = weight
+            else:
+                for index1, index2, weight in zip(starts, finishes, weights):
+                    edges[index1][index2] = weight
+            self._update_rows(starts, finishes, weights)
+            self._version += 1
+            return
+
+        for index1, index2, weight in zip(starts, finishes, weights):
+            old_weight = edges[index1][index2]
+
+            # Установка веса ребра в матрице смежности
+            edges[index1][index2] = weight
+            if self.is_not_directed:
+                # Если граф ненаправленный, установка веса в зеркальной ячейке
+                edges[index2][index1] = weight
+
+            if self._all_pairs is not None:
+                if old_weight is None or weight < old_weight:
+                    # Новое или подешевевшее ребро - сохраненные пути обновляются за O(V^2)
+                    self._all_pairs.relax_edge(index1, index2, weight)
+                    if self.is_not_directed:
+                        self._all_pairs.relax_edge(index2, index1, weight)
+                elif weight > old_weight:
+                    # Подорожавшее ребро могло лежать на кратчайших путях - нужен полный пересчет
+                    self._all_pairs = None
+        self._update_rows(starts, finishes, weights)
+        self._version += 1
+
+    def _update_rows(self, starts: List[int], finishes: List[int], weights: List[int]) -> None:
+        # Записанные ребра переносятся в списки соседей: O(степень) на ребро вместо перестроения всех строк
+        if self._rows is None:
+            return
+        for index1, index2, weight in zip(starts, finishes, weights):
+            self._set_in_rows(index1, index2, weight)
+            if self.is_not_directed:
+                self._set_in_rows(index2, index1, weight)
+
+    def _set_in_rows(self, start: int, finish: int, weight: Optional[int]) -> None:
+        # Номера соседей в строке идут по возрастанию, как в матрице; weight None - ребро удалено
+        if self._rows is None:
+            return
+        ids = self._rows[0][start]
+        row_weights = self._rows[1][start]
+        position = bisect_left(ids, finish)
+        if position < len(ids) and ids[position] == finish:
+            if weight is None:
+                del ids[position], row_weights[position]
+            else:
+                row_weights[position] = weight
+        elif weight is not None:
+            ids.insert(position, finish)
+            row_weights.insert(position, weight)
+
+    def _cached(self, algorithm: str, source: Optional[int], compute: Callable[[], R]) -> R:
+        # LRU-кэш по (алгоритм, стартовая вершина). Запись хранит версию графа, на которой посчитана:
+        # после add_vertex, add_edge или load_from_file версия другая, и результат считается заново
+        if self._cache is None:
+            return compute()
+        key = (algorithm, source)
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == self._version:
+            self._cache.move_to_end(key)
+            return entry[1]
+
+        value = compute()
+        self._cache[key] = (self._version, value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)  # самая давно использованная запись
+        return value
+
+    def amount_vertexes(self) -> int:
+        return len(self.vertexes)
+
+    def is_alive(self, vertex_id: int) -> bool:
+        # Все номера заняты вершинами: remove_vertex сдвигает номера (удаленные номера есть у AdjacencyListGraph)
+        return True
+
+    def for_each_vertex(self, callback: Callable[[T], None]) -> None:
+        for vertex in self.vertexes:
+            callback(vertex)
+
+    def for_each_edge(self, callback: Callable[[Edge[T]], None]) -> None:
+        # Обход всех ребер (для ненаправленного графа каждое ребро встречается в обе стороны)
+        for i, row in enumerate(self.edges):
+            for j, weight in enumerate(row):
+                if weight is not None:
+                    callback(Edge(self.vertexes[i], self.vertexes[j], weight))
+
+    def for_each_adjacent_edge(self, vertex: T, callback: Callable[[AdjacentEdge[T]], None]) -> None:
+        # Обход ребер, исходящих из вершины
+        targets, weights = self.adjacency()
+        vertex_index = self.index.id_of(vertex)
+        for j, weight in zip(targets[vertex_index], weights[vertex_index]):
+            callback(AdjacentEdge(self.vertexes[j], weight))
+
+    def adjacency(self) -> Tuple[List[List[int]], List[List[int]]]:
+        # Для каждой строки матрицы - номера соседей (по возрастанию) и веса ребер подряд, без пустых ячеек.
+        # Строятся за O(V^2) при первом обходе, дальше add_edge, remove_edge, add_vertex и remove_vertex
+        # правят только затронутые строки; целиком заново списки строятся только после load_from_file.
+        # Списки, а не array: элементы списка уже готовые объекты, а array создает число на каждое чтение
+        if self._rows is None:
+            targets: List[List[int]] = []
+            weights: List[List[int]] = []
+            for row in self.edges:
+                ids = [j for j, weight in enumerate(row) if weight is not None]
+                targets.append(ids)
+                weights.append([row[j] for j in ids])
+            self._rows = (targets, weights)
+        return self._rows
+
+    def neighbours(self, vertex_id: int) -> Iterator[Tuple[int, int]]:
+        # Соседи вершины по номерам: пары (номер соседа, вес)
+        targets, weights = self.adjacency()
+        return zip(targets[vertex_id], weights[vertex_id])
+
+    def neighbour_ids(self, vertex_id: int) -> Iterator[int]:
+        # Только номера соседей - для обходов, которым веса не нужны (без пар на каждое ребро)
+        return iter(self.adjacency()[0][vertex_id])
+
+    def neighbour_weights(self, vertex_id: int) -> Iterator[int]:
+        # Веса ребер в том же порядке, что и neighbour_ids
+        return iter(self.adjacency()[1][vertex_id])
+
+    def in_neighbours(self, vertex_id: int) -> Iterator[Tuple[int, int]]:
+        # Входящие ребра по номерам: пары (номер начала ребра, вес) - столбец матрицы
+        for i, row in enumerate(self.edges):
+            weight = row[vertex_id]
+            if weight is not None:
+                yield i, weight
+
+    def ford_bellman(self, start: T, end: T, detect_cycle: bool = False) -> Union[Tuple[List[T], int], "NegativeCycle[T]"]:
+        # Алгоритм Форда-Беллмана для поиска кратчайшего пути, результаты как у fordbellman.ford_bellman:
+        # ([], 0) при отрицательном цикле, с detect_cycle=True - сам цикл (NegativeCycle)
+        # Стоимости и предки считаются на всю стартовую вершину, поэтому кэш отвечает на запросы к любой end
+        start_index = self.index.id_of(start)
+        end_index = self.index.id_of(end)
+        result = self._cached("ford_bellman", start_index, lambda: self._ford_bellman_from(start_index))
+        if result is None:
+            return self.find_negative_cycle(start) if detect_cycle else ([], 0)
+
+        costs, predecessors = result
+        vertex = end_index
         path = []
-        while vertex is not None:
-            path.append(vertex)
-            vertex = nodes[vertex].predecessor
+        while vertex != -1:
+            path.append(self.vertexes[vertex])
+            vertex = predecessors[vertex]
         path.reverse()
-        return path, nodes[end].cost
-
-    def ford_warshall(self) -> List[List[int]]:
+        return path, costs[end_index]
+
+    def find_negative_cycle(self, start: Optional[T] = None) -> Optional["NegativeCycle[T]"]:
+        # Отрицательный цикл, достижимый из start (без start - любой), или None; см. fordbellman.find_negative_cycle
+        from fordbellman import find_negative_cycle
+        return self._cached("negative_cycle", None if start is None else self.index.id_of(start),
+                            lambda: find_negative_cycle(self, start))
+
+    def _ford_bellman_from(self, start_index: int) -> Optional[Tuple[List[float], List[int]]]:
+        # Стоимости и предки (-1 - нет) от start_index; None - из нее достижим отрицательный цикл.
+        # Внутренний цикл работает только с номерами вершин: стоимости и предки хранятся в списках
+        order = topological_order(self)
+        if order is not None:
+            # В ацикличном графе хватает одного прохода по ребрам в топологическом порядке
+            return dag_paths(self, start_index, order=order)
+
+        amount_vertex = len(self.vertexes)
+        costs: List[float] = [math.inf] * amount_vertex
+        predecessors: List[int] = [-1] * amount_vertex
+        costs[start_index] = 0
+
+        # Ребра из недостижимых вершин отбрасываются один раз, проходы идут по списку ребер
+        marked = reachable(self, start_index)
+        targets, weights = self.adjacency()
+        edges = [
+            (i, j, weight)
+            for i in range(amount_vertex) if marked[i]
+            for j, weight in zip(targets[i], weights[i])
+        ]
+
+        for _ in range(sum(marked) - 1):
+            changed = False
+            for i, j, weight in edges:
+                new_cost = costs[i] + weight
+                if new_cost < costs[j]:
+                    costs[j] = new_cost
+                    predecessors[j] = i
+                    changed = True
+            if not changed:
+                break
+
+        if any(costs[i] + weight < costs[j] for i, j, weight in edges):
+            return None
+        return costs, predecessors
+
+    def topological_sort(self) -> List[T]:
+        # Вершины в топологическом порядке, ValueError - в графе есть цикл
+        return topological_sort(self)
+
+    def dijkstra(self, start: T, end: Optional[T] = None) -> Union[Tuple[List[T], int], Dict[T, int]]:
+        # Кратчайший путь при неотрицательных весах, поиск останавливается на вершине end
+        return dijkstra(self, start, end)
+
+    def ford_warshall(self, use_numpy: bool = False) -> List[List[int]]:
         # Алгоритм Флойда-Уоршелла для поиска кратчайших путей между всеми парами вершин
+        if self._cache is None:
+            return self._ford_warshall(use_numpy)
+        # Из кэша отдается копия, чтобы изменение результата не испортило сохраненную матрицу
+        return [row[:] for row in self._cached("ford_warshall", None, lambda: self._ford_warshall(use_numpy))]
+
+    def _ford_warshall(self, use_numpy: bool) -> List[List[int]]:
+        if use_numpy:
+            # NumPy нужен только для этого варианта, поэтому импорт здесь
+            from ford_warshall_numpy import ford_warshall as ford_warshall_numpy
+            return ford_warshall_numpy(self)
+
         cost_matrix = [[float("inf") if val is None else val for val in row] for row in self.edges]
 
         for k in range(len(self.vertexes)):
@@ -91,6 +390,19 @@ class Graph:
         return cost_matrix
 
 
+    def ford_warshall_paths(self, use_numpy: bool = False) -> AllPairs[T]:
+        # Флойд-Уоршелл с матрицей следующего шага: result.path(u, v) и result.cost(u, v) без пересчета
+        if use_numpy:
+            from ford_warshall_numpy import ford_warshall_paths as ford_warshall_paths_numpy
+            return ford_warshall_paths_numpy(self)
+        return ford_warshall_paths(self)
+
+    def all_pairs(self, use_numpy: bool = False) -> AllPairs[T]:
+        # Сохраненный результат ford_warshall_paths; считается заново, только если был сброшен
+        if self._all_pairs is None:
+            self._all_pairs = self.ford_warshall_paths(use_numpy)
+        return self._all_pairs
+
     def save_to_file(self, filename: str) -> None:
         # Сохранение графа в файл
         with open(filename, "w") as file:
@@ -106,7 +418,11 @@ class Graph:
         # Загрузка графа из файла
         with open(filename, "r") as file:
             num_vertexes = int(file.readline())
-            self.vertexes = [file.readline().strip() for _ in range(num_vertexes)]
+            self.index = VertexIndex[T](file.readline().strip() for _ in range(num_vertexes))
+            self.vertexes = self.index.labels
+            self._all_pairs = None
+            self._rows = None
+            self._version += 1
 
             self.edges = []
             for _ in range(num_vertexes):
@@ -199,6 +515,8 @@ if __name__ == '__main__':
     for i, row in enumerate(cost_matrix):
         for j, cost in enumerate(row):
             print(f"Cost from {new_graph.vertexes[i]} to {new_graph.vertexes[j]}: {cost}")
+    all_pairs = new_graph.ford_warshall_paths()
+    print(f"Path: {all_pairs.path('E', 'C')} with cost: {all_pairs.cost('E', 'C')}")
     print("\nБенчмарки\n")
     benchmark_ford_bellman(graph, "E", "C")
     benchmark_floyd_warshall(graph)
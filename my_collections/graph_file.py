@@ -0,0 +1,118 @@
+"""
+Двоичный формат графа, который открывается через mmap без разбора текста.
+Структура файла (little-endian, все массивы выровнены на 8 байт):
+1) заголовок: b"GRPH", версия, флаги (бит 0 - направленный), количество вершин V, количество ребер E, размер таблицы вершин;
+2) таблица вершин: для каждой вершины длина (uint32) и имя в UTF-8;
+3) массивы CSR: offsets (int64, V + 1), targets (int64, E), weights (int64, E).
+load_binary возвращает CSRGraph, массивы которого смотрят прямо в отображенный файл: граф готов сразу после открытия,
+а несколько процессов, открывших один файл, делят одни и те же страницы в кэше ОС.
+При передаче в другой процесс такой граф сериализуется путем к файлу (CSRGraph.source) и открывается заново.
+Как и в save_to_file, вершины сохраняются строками.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable, Tuple
+
+from csr_graph import CSRGraph
+from vertex_index import VertexIndex
+
+MAGIC = b"GRPH"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHqqq")
+_LABEL_LENGTH = struct.Struct("<I")
+_DIRECTED = 1
+
+
+def save_binary(graph, filename: str) -> None:
+    # Граф на матрице смежности сначала переводится в CSR
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+
+    with open(filename, "wb") as file:
+        write_header(file, csr.vertexes, not csr.is_not_directed, csr.amount_edges())
+        for values in (csr.offsets, csr.targets, csr.weights):
+            file.write(_to_little_endian(values).tobytes())
+
+
+def write_header(file: BinaryIO, vertexes: Iterable, is_directed: bool, amount_edges: int) -> int:
+    # Пишет заголовок и таблицу вершин, возвращает размер записанного (с него начинается массив offsets)
+    labels = bytearray()
+    amount_vertex = 0
+    for vertex in vertexes:
+        encoded = str(vertex).encode("utf-8")
+        labels += _LABEL_LENGTH.pack(len(encoded))
+        labels += encoded
+        amount_vertex += 1
+    labels += bytes(-len(labels) % 8)
+
+    flags = _DIRECTED if is_directed else 0
+    file.write(_HEADER.pack(MAGIC, VERSION, flags, amount_vertex, amount_edges, len(labels)))
+    file.write(labels)
+    return _HEADER.size + len(labels)
+
+
+def load_binary(filename: str, use_numpy: bool = False) -> CSRGraph:
+    # use_numpy=True - массивы отдаются как numpy.memmap (для векторных алгоритмов)
+    with open(filename, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, flags, amount_vertex, amount_edges, labels_size = _HEADER.unpack_from(mapping, 0)
+    if magic != MAGIC or version != VERSION:
+        mapping.close()
+        raise ValueError(f"{filename} is not a binary graph file")
+
+    index = VertexIndex[str](_read_labels(mapping, _HEADER.size, amount_vertex))
+    offsets_begin = _HEADER.size + labels_size
+    targets_begin = offsets_begin + 8 * (amount_vertex + 1)
+    weights_begin = targets_begin + 8 * amount_edges
+
+    if use_numpy:
+        import numpy as np
+        mapping.close()  # numpy.memmap отображает файл сам
+
+        def view(begin: int, count: int):
+            return np.memmap(filename, dtype="<i8", mode="r", offset=begin, shape=(count,))
+    else:
+        if sys.byteorder != "little":
+            raise ValueError("mmap arrays require a little-endian machine, use use_numpy=True")
+        memory = memoryview(mapping)  # срезы memoryview держат отображение открытым, пока жив граф
+
+        def view(begin: int, count: int):
+            return memory[begin:begin + 8 * count].cast("q")
+
+    graph = CSRGraph(index, view(offsets_begin, amount_vertex + 1), view(targets_begin, amount_edges),
+                     view(weights_begin, amount_edges), is_directed=bool(flags & _DIRECTED))
+    graph.source = (os.path.abspath(filename), use_numpy)
+    return graph
+
+
+def _read_labels(mapping: mmap.mmap, begin: int, amount_vertex: int) -> Tuple[str, ...]:
+    labels = []
+    position = begin
+    for _ in range(amount_vertex):
+        (length,) = _LABEL_LENGTH.unpack_from(mapping, position)
+        position += _LABEL_LENGTH.size
+        labels.append(mapping[position:position + length].decode("utf-8"))
+        position += length
+    return tuple(labels)
+
+
+def _to_little_endian(values) -> array:
+    values = array("q", values)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+if __name__ == '__main__':
+    from graph import Graph
+
+    graph = Graph(is_directed=True)
+    graph.load_from_file("graph.txt")
+    save_binary(graph, "graph.bin")
+
+    new_graph = load_binary("graph.bin")
+    new_graph.print_all_vertexes()
+    new_graph.print_all_edges()
@@ -1,10 +1,8 @@
 from typing import Callable, Optional, Generic
 from dataclasses import dataclass
-from my_collections import MySet
+from dfs import dfs
 from graph import Graph, T
 
-__is_found: bool = False
-
 @dataclass
 class Edge(Generic[T]):
     start_edge: T
@@ -22,28 +20,12 @@ class AdjacentEdge(Generic[T]):
 
 
 def dsf(graph: Graph[T], start: T, target: T, visitfunc: Callable[[T], None] = None) -> None:
-    global __is_found
-    visited = MySet[T]()
-    __is_found = False
-    __dsf(graph, start, target, visited, visitfunc)
-
-
-def __dsf(graph: Graph[T], current: T, target: T, visited: MySet[T], visitfunc: Callable[[T], None]) -> None:
-    global __is_found
-    visited.add(current)
-
-    if visitfunc:
-        visitfunc(current)
-
-    if current == target:
-        __is_found = True
-        return
-
-    def __foreach(edge: AdjacentEdge[T]) -> None:
-        if not __is_found and edge.finish_edge not in visited:
-            __dsf(graph, edge.finish_edge, target, visited, visitfunc)
-
-    graph.for_each_adjacent_edge(current, __foreach)
+    # Обход в глубину до target на явном стеке (dfs.dfs), без рекурсии и глобального флага
+    for vertex in dfs(graph, start):
+        if visitfunc:
+            visitfunc(vertex)
+        if vertex == target:
+            return
 
 
 if __name__ == '__main__':
@@ -66,7 +48,9 @@ if __name__ == '__main__':
     graph: Graph[str] = Graph[str]()
 
     for it in vertexes:
-        graph.add_edge_without_weight(it.start_edge, it.finish_edge)
+        graph.add_vertex(it.start_edge)
+        graph.add_vertex(it.finish_edge)
+        graph.add_edge(it.start_edge, it.finish_edge, it.weight)
 
     def dsf_walk(vertex: str) -> bool:
         print(vertex + " ", end='')
@@ -0,0 +1,73 @@
+"""
+Алгоритм Джонсона - кратчайшие пути между всеми парами вершин для разреженных графов с отрицательными весами.
+1) Один раз считаются потенциалы h алгоритмом Форда-Беллмана от фиктивной вершины (fordbellman.potentials_by_id).
+2) Веса перевзвешиваются: w'(u, v) = w(u, v) + h(u) - h(v) >= 0, кратчайшие пути при этом не меняются.
+3) Из каждой вершины запускается Дейкстра по весам w', настоящая стоимость = d'(u, v) - h(u) + h(v).
+Сложность O(V * E + V * (V + E) log V) вместо O(V^3). Запуски Дейкстры независимы и могут идти в пуле процессов.
+Результат в том же формате, что у ford_warshall.ford_warshall: словарь словарей стоимостей (только достижимые вершины).
+Как и там, u -> u - это стоимость самого дешевого цикла через u (ключа нет, если цикла нет), а не 0 от Дейкстры:
+цикл замыкается входящим ребром w -> u, поэтому он равен min(d(u, w) + w(w, u)) по входящим ребрам.
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from dijkstra import shortest_paths
+from fordbellman import potentials_by_id
+from graph import Graph, T
+
+_graph = None
+_potential: Optional[List[int]] = None
+
+
+def johnson(graph: Graph[T], workers: Optional[int] = None) -> dict[T, dict[T, int]]:
+    potential = potentials_by_id(graph)
+    if potential is None:
+        raise ValueError("Graph contains a negative cycle")
+    # Номера удаленных вершин (AdjacencyListGraph до compact()) в результат не попадают
+    sources = [vertex for vertex in range(graph.amount_vertexes()) if graph.is_alive(vertex)]
+
+    if workers is None or workers <= 1:
+        rows = [_costs_from(graph, potential, source) for source in sources]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(graph, potential)) as pool:
+            rows = list(pool.map(_worker_costs_from, sources, chunksize=max(1, len(sources) // (4 * workers))))
+
+    cost_matrix: dict[T, dict[T, int]] = {}
+    for source, row in zip(sources, rows):
+        cost_matrix[graph.vertexes[source]] = {graph.vertexes[finish]: cost for finish, cost in row}
+    return cost_matrix
+
+
+def _costs_from(graph: Graph[T], potential: List[int], source: int) -> List[Tuple[int, int]]:
+    costs, _ = shortest_paths(graph, source, potential=potential)
+    row = [
+        (finish, cost - potential[source] + potential[finish])
+        for finish, cost in enumerate(costs)
+        if cost != math.inf and finish != source
+    ]
+    cycle = min((costs[start] - potential[source] + potential[start] + weight
+                 for start, weight in graph.in_neighbours(source) if costs[start] != math.inf), default=None)
+    if cycle is not None:
+        row.append((source, cycle))
+    return row
+
+
+def _init_worker(graph: Graph[T], potential: List[int]) -> None:
+    # Граф и потенциалы передаются в процесс один раз, а не с каждой задачей
+    global _graph, _potential
+    _graph = graph
+    _potential = potential
+
+
+def _worker_costs_from(source: int) -> List[Tuple[int, int]]:
+    return _costs_from(_graph, _potential, source)
+
+
+if __name__ == '__main__':
+    graph: Graph[str] = Graph[str](is_directed=True)
+    graph.load_from_file("graph.txt")
+
+    for key, val in johnson(graph).items():
+        print(f"Key: {key}, Val: {val}")
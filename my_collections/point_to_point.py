@@ -0,0 +1,138 @@
+"""
+Поиск пути между двумя вершинами без обхода всего графа.
+bidirectional_bfs - двунаправленный поиск в ширину (веса ребер не учитываются):
+1) Две волны идут навстречу друг другу: прямая от start по исходящим ребрам, обратная от end по входящим.
+2) Каждый раз целиком расширяется один уровень меньшей волны.
+3) Как только волны встретились, среди встреч этого уровня берется самая короткая, путь склеивается из двух половин.
+При степени ветвления b и расстоянии d просматривается около 2 * b^(d / 2) вершин вместо b^d.
+a_star - Дейкстра, в которой вершины извлекаются из кучи по cost + heuristic(vertex).
+heuristic(vertex) - оценка стоимости от vertex до end снизу (не больше настоящей), иначе путь может быть не кратчайшим.
+С heuristic = 0 это обычная Дейкстра; чем точнее оценка, тем меньше вершин раскрывается.
+Обе функции возвращают и количество раскрытых вершин (тех, чьи соседи были просмотрены).
+"""
+import heapq
+import math
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def bidirectional_bfs(graph, start: T, end: T) -> Tuple[List[T], int]:
+    # Возвращает (путь с наименьшим числом ребер, количество раскрытых вершин); пустой путь - end недостижима
+    start_id = graph.index.id_of(start)
+    end_id = graph.index.id_of(end)
+    if start_id == end_id:
+        return [start], 0
+
+    # parents[v] - откуда пришли в v, distances[v] - число ребер от своей стартовой вершины
+    forward_parents: Dict[int, int] = {start_id: -1}
+    backward_parents: Dict[int, int] = {end_id: -1}
+    forward_distances: Dict[int, int] = {start_id: 0}
+    backward_distances: Dict[int, int] = {end_id: 0}
+    forward_frontier: List[int] = [start_id]
+    backward_frontier: List[int] = [end_id]
+    expanded = 0
+
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            expanded += len(forward_frontier)
+            forward_frontier, meeting = _expand_level(forward_frontier, graph.neighbours, forward_parents,
+                                                      forward_distances, backward_distances)
+        else:
+            expanded += len(backward_frontier)
+            backward_frontier, meeting = _expand_level(backward_frontier, graph.in_neighbours, backward_parents,
+                                                       backward_distances, forward_distances)
+        if meeting is not None:
+            break
+    else:
+        return [], expanded
+
+    # Прямая половина идет от встречи к start и разворачивается, обратная - от встречи к end
+    path = list(_walk(forward_parents, meeting))
+    path.reverse()
+    path.extend(_walk(backward_parents, backward_parents[meeting]))
+    return [graph.vertexes[vertex] for vertex in path], expanded
+
+
+def a_star(graph, start: T, end: T, heuristic: Callable[[T], float]) -> Tuple[List[T], float, int]:
+    # Возвращает (путь, стоимость, количество раскрытых вершин); путь и стоимость в формате ford_bellman
+    start_id = graph.index.id_of(start)
+    end_id = graph.index.id_of(end)
+    labels = graph.vertexes
+    estimates: Dict[int, float] = {}  # значения эвристики считаются один раз на вершину
+
+    def estimate(vertex: int) -> float:
+        value = estimates.get(vertex)
+        if value is None:
+            value = estimates[vertex] = heuristic(labels[vertex])
+        return value
+
+    costs: Dict[int, float] = {start_id: 0}
+    predecessors: Dict[int, int] = {start_id: -1}
+    heap: List[Tuple[float, float, int]] = [(estimate(start_id), 0, start_id)]
+    expanded = 0
+
+    while heap:
+        _, cost, vertex = heapq.heappop(heap)
+        if cost > costs[vertex]:
+            continue  # устаревшая запись
+        if vertex == end_id:
+            return [labels[v] for v in reversed(list(_walk(predecessors, vertex)))], cost, expanded
+
+        expanded += 1
+        for finish, weight in graph.neighbours(vertex):
+            if weight < 0:
+                raise ValueError("A* requires non-negative edge weights")
+            new_cost = cost + weight
+            if new_cost < costs.get(finish, math.inf):
+                costs[finish] = new_cost
+                predecessors[finish] = vertex
+                heapq.heappush(heap, (new_cost + estimate(finish), new_cost, finish))
+
+    return [labels[end_id]], math.inf, expanded
+
+
+def _expand_level(frontier: List[int], neighbours: Callable[[int], Iterator[Tuple[int, int]]],
+                  parents: Dict[int, int], distances: Dict[int, int],
+                  other_distances: Dict[int, int]) -> Tuple[List[int], Optional[int]]:
+    # Расширяет один уровень волны. Возвращает (следующий уровень, вершина встречи или None).
+    # Уровень доводится до конца, чтобы из всех встреч выбрать ту, что дает самый короткий путь
+    next_frontier: List[int] = []
+    meeting = None
+    best_length = math.inf
+    for vertex in frontier:
+        distance = distances[vertex] + 1
+        for finish, _ in neighbours(vertex):
+            if finish not in parents:
+                parents[finish] = vertex
+                distances[finish] = distance
+                next_frontier.append(finish)
+            if finish in other_distances and distances[finish] + other_distances[finish] < best_length:
+                best_length = distances[finish] + other_distances[finish]
+                meeting = finish
+    return next_frontier, meeting
+
+
+def _walk(parents: Dict[int, int], vertex: int) -> Iterator[int]:
+    while vertex != -1:
+        yield vertex
+        vertex = parents[vertex]
+
+
+if __name__ == '__main__':
+    from csr_graph import CSRGraph
+    from graph import Edge
+
+    # Решетка 100 x 100 с единичными весами, эвристика - манхэттенское расстояние
+    size = 100
+    edges = [Edge((x, y), (x + 1, y), 1) for x in range(size - 1) for y in range(size)]
+    edges += [Edge((x, y), (x, y + 1), 1) for x in range(size) for y in range(size - 1)]
+    grid: CSRGraph = CSRGraph.from_edges(edges)
+
+    start, end = (0, 0), (20, 30)
+    path, expanded = bidirectional_bfs(grid, start, end)
+    print(f"Bidirectional BFS: length {len(path) - 1}, expanded {expanded}")
+    path, cost, expanded = a_star(grid, start, end, lambda vertex: abs(vertex[0] - end[0]) + abs(vertex[1] - end[1]))
+    print(f"A*: cost {cost}, expanded {expanded}")
+    path, cost, expanded = a_star(grid, start, end, lambda vertex: 0)
+    print(f"Dijkstra: cost {cost}, expanded {expanded}")
@@ -0,0 +1,45 @@
+from typing import TypeVar, Generic, List, Iterable, Iterator, Optional
+
+T = TypeVar("T")
+
+
+class VertexIndex(Generic[T]):
+    # Соответствие "вершина -> номер" и обратно, номера идут подряд с нуля.
+    # Поиск номера по словарю - O(1) вместо list.index / "in" по списку вершин.
+    def __init__(self, labels: Optional[Iterable[T]] = None) -> None:
+        self.labels: List[T] = []
+        self._ids: dict[T, int] = {}
+        if labels is not None:
+            for label in labels:
+                self.add(label)
+
+    def add(self, label: T) -> int:
+        # Возвращает номер вершины, новой вершине выдается следующий свободный номер
+        vertex_id = self._ids.get(label)
+        if vertex_id is None:
+            vertex_id = len(self.labels)
+            self._ids[label] = vertex_id
+            self.labels.append(label)
+        return vertex_id
+
+    def discard(self, label: T) -> None:
+        # Метка больше не ищется, но ее номер не освобождается (его слот в labels остается до перестроения индекса)
+        self._ids.pop(label, None)
+
+    def id_of(self, label: T) -> int:
+        vertex_id = self._ids.get(label)
+        if vertex_id is None:
+            raise ValueError(f"Vertex {label} is not in the graph")
+        return vertex_id
+
+    def label_of(self, vertex_id: int) -> T:
+        return self.labels[vertex_id]
+
+    def __contains__(self, label: T) -> bool:
+        return label in self._ids
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.labels)